@@ -8,15 +8,124 @@ A professional-grade system using the official YouTube API for:
 """
 
 import os
+import re
 import sys
 import json
 import time
+import heapq
+import queue
+import atexit
+import logging
+import argparse
+import importlib
+import importlib.util
 import webbrowser
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Your YouTube API key - change this to your actual key
 YOUTUBE_API_KEY = "YOUR_API_KEY_HERE"
 
+_DIGIT_RE = re.compile(r'\d')
+
+# Competitor database and the niche -> count index CompetitorAnalyzer keeps beside it
+COMPETITOR_DB_FILE = 'competitor_database.json'
+COMPETITOR_INDEX_FILE = 'competitor_database.index.json'
+
+# YouTube URL formats understood by YouTubeAPIExtractor.extract_video_id
+_VIDEO_URL_RE = re.compile(r'(?:youtube\.com/(?:watch\?(?:[^#]*&)?v=|embed/|v/)|youtu\.be/)[A-Za-z0-9_-]{11}')
+_CHANNEL_URL_RE = re.compile(r'/channel/([A-Za-z0-9_-]+)')
+_CUSTOM_CHANNEL_URL_RE = re.compile(r'/(?:c|user)/')
+
+# Niche menu shown by get_niche()
+NICHE_MAP = MappingProxyType({
+    "1": "productivity",
+    "2": "health_fitness",
+    "3": "ai_tech"
+})
+
+_NICHE_MENU = """
+Select content niche:
+1. Productivity
+2. Health & Fitness
+3. AI & Technology"""
+
+@lru_cache(maxsize=8)
+def _parse_json_file(path, mtime_ns):
+    """Parse a JSON file (cached per path and modification time)"""
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _load_json(path):
+    """Load a JSON file, only re-parsing it when it changed on disk.
+    
+    The returned data is shared between callers and must not be modified.
+    """
+    path = str(path)
+    return _parse_json_file(path, os.stat(path).st_mtime_ns)
+
+def niche_video_count(niche):
+    """Number of videos stored for a niche in the competitor database
+    
+    Uses the small count index written by CompetitorAnalyzer when it is at
+    least as new as the database, and parses the full database otherwise.
+    """
+    db_mtime = os.stat(COMPETITOR_DB_FILE).st_mtime_ns
+    try:
+        if os.stat(COMPETITOR_INDEX_FILE).st_mtime_ns >= db_mtime:
+            return _load_json(COMPETITOR_INDEX_FILE).get(niche, 0)
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    return len(_load_json(COMPETITOR_DB_FILE).get(niche, []))
+
+def _atomic_write(path, data):
+    """Write bytes to path via a temp file so readers never see a partial file"""
+    # Shared with CompetitorAnalyzer; imported on first use like the other components
+    from competitor_analysis import atomic_write
+    atomic_write(path, data)
+
+def _dump(path, obj):
+    """Serialize obj as indented JSON and write it to path"""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        data = json.dumps(obj, indent=2).encode('utf-8')
+    _atomic_write(path, data)
+
+# Tasks that can be run non-interactively with --batch
+BATCH_TASKS = ("analyze-top", "analyze-channel", "dna-analysis")
+
+# System components: class name -> (module, whether it takes the API key)
+_COMPONENT_SOURCES = {
+    "YouTubeOptimizer": ("youtube_optimizer", False),
+    "YouTubeOptimizerSystem": ("youtube_optimizer_system", False),
+    "YouTubeAPIExtractor": ("youtube_api_extractor", True),
+    "APIIntegrationModule": ("api_integration_module", True),
+    "DataIntegrationModule": ("data_integration_module", False)
+}
+
+# Components created so far, keyed by class name
+_components = {}
+
+def get_component(class_name):
+    """Import and create a system component the first time it is needed"""
+    component = _components.get(class_name)
+    if component is None:
+        module_name, needs_api_key = _COMPONENT_SOURCES[class_name]
+        component_class = getattr(importlib.import_module(module_name), class_name)
+        component = component_class(YOUTUBE_API_KEY) if needs_api_key else component_class()
+        _components[class_name] = component
+    return component
+
 def check_requirements():
     """Check if all required files and packages are available"""
     required_files = [
@@ -28,11 +137,10 @@ def check_requirements():
         "data_integration_module.py"
     ]
     
-    # Check for required files
-    missing_files = []
-    for file in required_files:
-        if not os.path.exists(file):
-            missing_files.append(file)
+    # Check for required files (one directory listing instead of a stat per file)
+    with os.scandir('.') as entries:
+        present = {entry.name for entry in entries}
+    missing_files = [file for file in required_files if file not in present]
     
     if missing_files:
         print("Error: Some required files are missing:")
@@ -41,20 +149,95 @@ def check_requirements():
         print("\nPlease make sure all component files are in the same directory.")
         return False
     
-    # Check for required packages
-    try:
-        import requests
-        import numpy
-    except ImportError as e:
-        print(f"Error: Missing required package: {str(e)}")
+    # Check for required packages without importing them yet
+    missing_packages = [name for name in ("requests", "numpy") if importlib.util.find_spec(name) is None]
+    if missing_packages:
+        print(f"Error: Missing required package(s): {', '.join(missing_packages)}")
         print("\nPlease install required packages using:")
         print("pip install requests numpy")
         return False
         
     return True
 
+def parse_args(argv=None):
+    """Parse command line options (all optional; no options starts the menu)"""
+    parser = argparse.ArgumentParser(
+        description="API-Powered YouTube Content Optimizer. Run without options for the interactive menu."
+    )
+    parser.add_argument("--batch", choices=BATCH_TASKS,
+                        help="run a single task without prompts and exit")
+    parser.add_argument("--niche", choices=tuple(NICHE_MAP.values()) + ("all",), default="all",
+                        help="niche to process in batch mode (default: all; analyze-channel needs a single niche)")
+    parser.add_argument("--count", type=int, default=5,
+                        help="number of videos to analyze, 1-10 (default: 5)")
+    parser.add_argument("--channel",
+                        help="channel ID or /channel/ URL for the analyze-channel task")
+    
+    args = parser.parse_args(argv)
+    if args.batch == "analyze-channel" and not args.channel:
+        parser.error("--channel is required for the analyze-channel task")
+    if args.batch == "analyze-channel" and args.niche == "all":
+        # One channel's videos belong to a single niche
+        parser.error("--niche must name a single niche for the analyze-channel task")
+    return args
+
+def run_batch(args):
+    """Run a batch task for one or all niches; returns a process exit code"""
+    if not check_requirements():
+        return 1
+    
+    if not YOUTUBE_API_KEY or YOUTUBE_API_KEY == "YOUR_API_KEY_HERE":
+        print("Error: Please set your YouTube API key in the script.")
+        return 1
+    
+    Path("data").mkdir(exist_ok=True)
+    Path("output").mkdir(exist_ok=True)
+    
+    api_integrator = get_component("APIIntegrationModule")
+    niches = list(NICHE_MAP.values()) if args.niche == "all" else [args.niche]
+    num_videos = max(1, min(10, args.count))  # Ensure between 1 and 10
+    
+    failed = 0
+    for niche in niches:
+        if args.batch == "analyze-top":
+            result = find_and_analyze_top_videos(api_integrator, niche=niche, num_videos=num_videos, interactive=False)
+        elif args.batch == "analyze-channel":
+            result = analyze_successful_channel(api_integrator, channel_input=args.channel, niche=niche,
+                                                num_videos=num_videos, interactive=False)
+        else:
+            result = advanced_content_dna_analysis(api_integrator, niche=niche, interactive=False)
+        
+        if not result.get('success', False):
+            failed += 1
+    
+    print(f"\nBatch '{args.batch}' finished: {len(niches) - failed}/{len(niches)} niches succeeded")
+    return 1 if failed else 0
+
+def setup_logging(batch=False):
+    """Show component progress messages on stdout
+    
+    In batch mode records go through a queue to a listener thread, so pool
+    workers never block on console output.
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    if batch:
+        log_queue = queue.Queue(-1)
+        listener = QueueListener(log_queue, handler)
+        listener.start()
+        atexit.register(listener.stop)
+        handler = QueueHandler(log_queue)
+    
+    logging.basicConfig(level=logging.INFO, handlers=[handler])
+
 def main():
     """Main entry point for the API-Powered YouTube Content Optimizer"""
+    args = parse_args()
+    setup_logging(batch=bool(args.batch))
+    if args.batch:
+        sys.exit(run_batch(args))
+    
     print("=" * 70)
     print("API-Powered YouTube Content Optimizer - Production Version")
     print("=" * 70)
@@ -77,15 +260,6 @@ def main():
         input("\nPress Enter to exit...")
         return
     
-    # Import system components
-    print("\nInitializing system components...")
-    from youtube_optimizer import YouTubeOptimizer
-    from competitor_analysis import CompetitorAnalyzer
-    from youtube_optimizer_system import YouTubeOptimizerSystem
-    from youtube_api_extractor import YouTubeAPIExtractor
-    from api_integration_module import APIIntegrationModule
-    from data_integration_module import DataIntegrationModule
-    
     # Create data directories if they don't exist
     data_dir = Path("data")
     data_dir.mkdir(exist_ok=True)
@@ -93,18 +267,13 @@ def main():
     output_dir = Path("output")
     output_dir.mkdir(exist_ok=True)
     
-    # Initialize components
-    print("Connecting to YouTube API...")
-    optimizer = YouTubeOptimizer()
-    competitor_analyzer = CompetitorAnalyzer()
-    optimizer_system = YouTubeOptimizerSystem()
-    api_extractor = YouTubeAPIExtractor(YOUTUBE_API_KEY)
-    api_integrator = APIIntegrationModule(YOUTUBE_API_KEY)
-    data_integrator = DataIntegrationModule()
+    # Other system components are imported when a menu option first needs them
+    print("\nConnecting to YouTube API...")
+    api_extractor = get_component("YouTubeAPIExtractor")
     
     # Test API connection
     try:
-        test_result = api_extractor.get_video_details("dQw4w9WgXcQ")
+        test_result = api_extractor.validate_key()
         if not test_result.get('success', False):
             error_msg = test_result.get('error', 'Unknown error')
             if "API key" in error_msg or "quota" in error_msg:
@@ -136,42 +305,42 @@ def main():
         choice = input("\nEnter your choice (1-8): ")
         
         if choice == "1":
-            find_and_analyze_top_videos(api_integrator)
+            find_and_analyze_top_videos(get_component("APIIntegrationModule"))
         elif choice == "2":
-            analyze_specific_video(api_integrator)
+            analyze_specific_video(get_component("APIIntegrationModule"))
         elif choice == "3":
-            analyze_successful_channel(api_integrator)
+            analyze_successful_channel(get_component("APIIntegrationModule"))
         elif choice == "4":
-            script_optimization(optimizer, data_integrator)
+            script_optimization(get_component("YouTubeOptimizer"), get_component("DataIntegrationModule"))
         elif choice == "5":
-            title_description_generator(optimizer, data_integrator)
+            title_description_generator(get_component("YouTubeOptimizer"), get_component("DataIntegrationModule"))
         elif choice == "6":
-            complete_video_optimization(optimizer_system, data_integrator)
+            complete_video_optimization(get_component("YouTubeOptimizerSystem"), get_component("DataIntegrationModule"))
         elif choice == "7":
-            advanced_content_dna_analysis(api_integrator)
+            advanced_content_dna_analysis(get_component("APIIntegrationModule"))
         elif choice == "8":
             print("\nExiting. Thank you for using the API-Powered YouTube Content Optimizer!")
             break
         else:
             print("\nInvalid choice. Please try again.")
 
-def find_and_analyze_top_videos(api_integrator):
-    """Find and analyze top performing videos in a niche"""
+def find_and_analyze_top_videos(api_integrator, niche=None, num_videos=None, interactive=True):
+    """Find and analyze top performing videos in a niche
+    
+    Arguments that are left as None are asked for interactively.
+    """
     print("\n" + "=" * 50)
     print("FIND & ANALYZE TOP VIDEOS")
     print("=" * 50)
     print("This will automatically find and analyze top-performing videos in your niche")
     
     # Get niche
-    niche = get_niche()
+    if niche is None:
+        niche = get_niche()
     
     # Get number of videos to analyze
-    try:
-        num_videos = int(input("\nHow many top videos would you like to analyze? (1-10): "))
-        num_videos = max(1, min(10, num_videos))  # Ensure between 1 and 10
-    except ValueError:
-        print("Invalid number. Using default of 5 videos.")
-        num_videos = 5
+    if num_videos is None:
+        num_videos = ask_video_count("\nHow many top videos would you like to analyze? (1-10): ")
     
     print(f"\nFinding and analyzing top {num_videos} videos in the {niche} niche...")
     print("This process will take some time. Please be patient...")
@@ -181,7 +350,7 @@ def find_and_analyze_top_videos(api_integrator):
     
     if not result.get('success', False):
         print(f"\nError: {result.get('error', 'Unknown error occurred')}")
-        return
+        return result
     
     print(f"\nAnalysis complete! Successfully processed {result.get('processed_count', 0)} videos")
     
@@ -191,18 +360,21 @@ def find_and_analyze_top_videos(api_integrator):
         print(f"Full analysis saved to: {result.get('analysis_file', 'data directory')}")
         
         # Ask if user wants to open the analysis
-        open_file = input("\nWould you like to open the analysis file? (y/n): ").lower() == 'y'
-        if open_file and result.get('analysis_file'):
-            try:
-                if sys.platform == 'win32':
-                    os.startfile(result['analysis_file'])
-                else:
-                    webbrowser.open(f"file://{os.path.abspath(result['analysis_file'])}")
-            except Exception as e:
-                print(f"Error opening file: {str(e)}")
+        if interactive:
+            open_file = input("\nWould you like to open the analysis file? (y/n): ").lower() == 'y'
+            if open_file and result.get('analysis_file'):
+                try:
+                    if sys.platform == 'win32':
+                        os.startfile(result['analysis_file'])
+                    else:
+                        webbrowser.open(f"file://{os.path.abspath(result['analysis_file'])}")
+                except Exception as e:
+                    print(f"Error opening file: {str(e)}")
     else:
         print("\nContent DNA analysis was not completed.")
         print("You can run it separately from the main menu.")
+    
+    return result
 
 def analyze_specific_video(api_integrator):
     """Analyze a specific YouTube video"""
@@ -213,7 +385,7 @@ def analyze_specific_video(api_integrator):
     
     # Get video URL
     video_url = input("\nEnter the YouTube URL of the video to analyze: ")
-    if not video_url or "youtube.com" not in video_url and "youtu.be" not in video_url:
+    if not _VIDEO_URL_RE.search(video_url):
         print("Invalid YouTube URL. Please enter a valid URL.")
         return
     
@@ -271,41 +443,43 @@ def analyze_specific_video(api_integrator):
     if run_dna:
         run_content_dna_analysis(api_integrator, niche)
 
-def analyze_successful_channel(api_integrator):
-    """Analyze videos from a successful channel"""
+def analyze_successful_channel(api_integrator, channel_input=None, niche=None, num_videos=None, interactive=True):
+    """Analyze videos from a successful channel
+    
+    Arguments that are left as None are asked for interactively.
+    """
     print("\n" + "=" * 50)
     print("ANALYZE SUCCESSFUL CHANNEL")
     print("=" * 50)
     print("This will analyze videos from a successful channel in your niche")
     
     # Get channel ID or URL
-    channel_input = input("\nEnter the YouTube channel ID or full channel URL: ")
+    if channel_input is None:
+        channel_input = input("\nEnter the YouTube channel ID or full channel URL: ")
     
     # Extract channel ID from URL if needed
     channel_id = channel_input
     if "youtube.com" in channel_input:
-        if "/channel/" in channel_input:
-            channel_id = channel_input.split("/channel/")[1].split("/")[0]
-        elif "/c/" in channel_input or "/user/" in channel_input:
+        channel_match = _CHANNEL_URL_RE.search(channel_input)
+        if channel_match:
+            channel_id = channel_match.group(1)
+        elif _CUSTOM_CHANNEL_URL_RE.search(channel_input):
             print("Please use the channel ID instead of custom URL.")
             print("You can find the channel ID by viewing the channel page source")
             print("and searching for 'channelId'.")
-            return
+            return {"success": False, "error": "Custom channel URLs are not supported"}
     
     if not channel_id:
         print("Invalid channel ID or URL.")
-        return
+        return {"success": False, "error": "Invalid channel ID or URL"}
     
     # Get niche
-    niche = get_niche()
+    if niche is None:
+        niche = get_niche()
     
     # Get number of videos to analyze
-    try:
-        num_videos = int(input("\nHow many videos would you like to analyze from this channel? (1-10): "))
-        num_videos = max(1, min(10, num_videos))  # Ensure between 1 and 10
-    except ValueError:
-        print("Invalid number. Using default of 5 videos.")
-        num_videos = 5
+    if num_videos is None:
+        num_videos = ask_video_count("\nHow many videos would you like to analyze from this channel? (1-10): ")
     
     print(f"\nAnalyzing {num_videos} videos from channel {channel_id}...")
     print("This process will take some time. Please be patient...")
@@ -314,14 +488,17 @@ def analyze_successful_channel(api_integrator):
     
     if not result.get('success', False):
         print(f"\nError: {result.get('error', 'Unknown error occurred')}")
-        return
+        return result
     
     print(f"\nAnalysis complete! Successfully processed {result.get('processed_count', 0)} videos")
     
     # Run content DNA analysis
-    run_dna = input("\nWould you like to run content DNA analysis now? (y/n): ").lower() == 'y'
-    if run_dna:
-        run_content_dna_analysis(api_integrator, niche)
+    if interactive:
+        run_dna = input("\nWould you like to run content DNA analysis now? (y/n): ").lower() == 'y'
+        if run_dna:
+            run_content_dna_analysis(api_integrator, niche)
+    
+    return result
 
 def script_optimization(optimizer, data_integrator):
     """Optimize a script using content DNA patterns"""
@@ -351,20 +528,11 @@ def script_optimization(optimizer, data_integrator):
     
     script_text = ""
     if input_choice == "1":
-        print("\nEnter your script (type 'END' on a new line when finished):")
-        script_lines = []
-        while True:
-            line = input()
-            if line == "END":
-                break
-            script_lines.append(line)
-        
-        script_text = "\n".join(script_lines)
+        script_text = read_script_text()
     elif input_choice == "2":
         file_path = input("\nEnter the path to your script file: ")
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                script_text = f.read()
+            script_text = Path(file_path).read_text(encoding='utf-8')
             print(f"Loaded script: {len(script_text.split())} words")
         except Exception as e:
             print(f"Error loading file: {str(e)}")
@@ -391,13 +559,12 @@ def script_optimization(optimizer, data_integrator):
     timestamp = int(time.time())
     output_file = Path("output") / f"script_optimization_{niche}_{timestamp}.json"
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump({
-            "script_word_count": len(script_text.split()),
-            "standard_analysis": analysis,
-            "content_dna_recommendations": dna_recommendations,
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-        }, f, indent=4)
+    _dump(output_file, {
+        "script_word_count": len(script_text.split()),
+        "standard_analysis": analysis,
+        "content_dna_recommendations": dna_recommendations,
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+    })
     
     # Print results
     print("\n" + "=" * 50)
@@ -468,15 +635,7 @@ def title_description_generator(optimizer, data_integrator):
     topic = ""
     
     if input_choice == "1":
-        print("\nEnter your script (type 'END' on a new line when finished):")
-        script_lines = []
-        while True:
-            line = input()
-            if line == "END":
-                break
-            script_lines.append(line)
-        
-        script_text = "\n".join(script_lines)
+        script_text = read_script_text()
         topic = input("\nEnter a brief topic/focus for the video: ")
     elif input_choice == "2":
         topic = input("\nEnter your video topic: ")
@@ -494,8 +653,7 @@ def title_description_generator(optimizer, data_integrator):
     title_dna = {}
     if analysis_file.exists():
         try:
-            with open(analysis_file, 'r', encoding='utf-8') as f:
-                dna_analysis = json.load(f)
+            dna_analysis = _load_json(analysis_file)
             
             dna_patterns = dna_analysis.get('content_dna_patterns', [])
             title_dna = dna_analysis.get('title_dna', {})
@@ -514,31 +672,37 @@ def title_description_generator(optimizer, data_integrator):
         print(f"Used by {title_pattern.get('prevalence', 0):.1f}% of successful videos\n")
     
     # Show top keywords if available
+    top_keywords = []
     if title_dna and 'keywords' in title_dna:
         top_keywords = [k['word'] for k in title_dna['keywords'][:5]]
         print(f"Top performing keywords: {', '.join(top_keywords)}\n")
+    # Lowercased once here instead of per title option
+    keyword_set = frozenset(k.lower() for k in top_keywords)
+    
+    # The DNA title pattern is the same for every option, so resolve it once
+    pattern_type = title_pattern.get('pattern', '').split('_')[0] if title_pattern else ''
     
     # Show title options
     for i, option in enumerate(title_options.get('title_options', [])):
-        print(f"{i+1}. {option['title']} (CTR Score: {option['ctr_score']})")
+        title = option['title']
+        title_lower = title.lower()
+        print(f"{i+1}. {title} (CTR Score: {option['ctr_score']})")
         
         # Check if this title aligns with DNA patterns
         matches_dna = False
-        if title_pattern:
-            pattern_type = title_pattern.get('pattern', '').split('_')[0]
-            if pattern_type == 'question' and '?' in option['title']:
-                matches_dna = True
-            elif pattern_type == 'number' and any(c.isdigit() for c in option['title']):
-                matches_dna = True
-            elif pattern_type == 'how' and option['title'].lower().startswith('how'):
-                matches_dna = True
+        if pattern_type == 'question':
+            matches_dna = '?' in title
+        elif pattern_type == 'number':
+            matches_dna = _DIGIT_RE.search(title) is not None
+        elif pattern_type == 'how':
+            matches_dna = title_lower.startswith('how')
         
         if matches_dna:
             print("   ✓ Matches content DNA pattern")
         
         # Check for top keywords
-        if top_keywords:
-            matched_keywords = [k for k in top_keywords if k in option['title'].lower()]
+        if keyword_set:
+            matched_keywords = [k for k in keyword_set if k in title_lower]
             if matched_keywords:
                 print(f"   ✓ Contains {len(matched_keywords)} top keywords")
     
@@ -558,18 +722,16 @@ def title_description_generator(optimizer, data_integrator):
     timestamp = int(time.time())
     output_file = Path("output") / f"title_description_{niche}_{timestamp}.json"
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump({
-            "title_options": title_options,
-            "selected_title": selected_title,
-            "description": description,
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-        }, f, indent=4)
+    _dump(output_file, {
+        "title_options": title_options,
+        "selected_title": selected_title,
+        "description": description,
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+    })
     
     # Also save as plain text for easy copying
     text_file = Path("output") / f"description_{niche}_{timestamp}.txt"
-    with open(text_file, 'w', encoding='utf-8') as f:
-        f.write(f"TITLE:\n{selected_title}\n\nDESCRIPTION:\n{description['description']}")
+    _atomic_write(text_file, f"TITLE:\n{selected_title}\n\nDESCRIPTION:\n{description['description']}".encode('utf-8'))
     
     # Show results
     print("\n" + "=" * 50)
@@ -641,8 +803,11 @@ def complete_video_optimization(optimizer_system, data_integrator):
             except Exception as e:
                 print(f"Error opening report: {str(e)}")
 
-def advanced_content_dna_analysis(api_integrator):
-    """Run advanced content DNA analysis"""
+def advanced_content_dna_analysis(api_integrator, niche=None, interactive=True):
+    """Run advanced content DNA analysis
+    
+    The niche is asked for interactively when it is left as None.
+    """
     print("\n" + "=" * 50)
     print("ADVANCED CONTENT DNA ANALYSIS")
     print("=" * 50)
@@ -650,34 +815,33 @@ def advanced_content_dna_analysis(api_integrator):
     print("to identify the 'Content DNA' of successful videos")
     
     # Get niche
-    niche = get_niche()
+    if niche is None:
+        niche = get_niche()
     
     # Check if we have enough data
     try:
-        with open('competitor_database.json', 'r') as f:
-            competitor_data = json.load(f)
+        video_count = niche_video_count(niche)
             
-        if niche not in competitor_data or len(competitor_data[niche]) < 3:
+        if video_count < 3:
             print(f"\nNot enough data for {niche} niche.")
             print("You need at least 3 videos in your database.")
             print("Use options 1, 2, or 3 to add videos first.")
-            return
-            
-        video_count = len(competitor_data[niche])
+            return {"success": False, "error": f"Not enough data for {niche} niche"}
     except (FileNotFoundError, json.JSONDecodeError):
         print("\nNo competitor data found.")
         print("Use options 1, 2, or 3 to add videos first.")
-        return
+        return {"success": False, "error": "No competitor data found"}
     
     # Run enhanced analysis
     print(f"\nAnalyzing content DNA patterns across {video_count} videos...")
-    result = run_content_dna_analysis(api_integrator, niche)
+    result = run_content_dna_analysis(api_integrator, niche, interactive=interactive)
     
     if not result.get('success', False):
         print(f"\nError: {result.get('error', 'Unknown error occurred')}")
-        return
+    
+    return result
 
-def run_content_dna_analysis(api_integrator, niche):
+def run_content_dna_analysis(api_integrator, niche, interactive=True):
     """Run content DNA analysis and show results"""
     result = api_integrator.run_content_dna_analysis(niche)
     
@@ -690,8 +854,7 @@ def run_content_dna_analysis(api_integrator, niche):
     
     try:
         # Load the analysis file
-        with open(result['analysis_file'], 'r') as f:
-            analysis = json.load(f)
+        analysis = _load_json(result['analysis_file'])
             
         # Show content DNA patterns
         print("\nContent DNA Patterns:")
@@ -715,45 +878,60 @@ def run_content_dna_analysis(api_integrator, niche):
                 
             print("\nSuccessful Title Structures:")
             structures = title_dna.get('structures', {})
-            sorted_structures = sorted(structures.items(), key=lambda x: x[1]['percentage'], reverse=True)
-            for structure, data in sorted_structures[:3]:
+            top_structures = heapq.nlargest(3, structures.items(), key=lambda x: x[1]['percentage'])
+            for structure, data in top_structures:
                 print(f"- {structure.replace('_', ' ').title()}: {data['percentage']:.1f}%")
         
         print(f"\nDetailed analysis saved to: {result['analysis_file']}")
         
         # Ask if user wants to open the analysis
-        open_file = input("\nWould you like to open the full analysis file? (y/n): ").lower() == 'y'
-        if open_file:
-            try:
-                if sys.platform == 'win32':
-                    os.startfile(result['analysis_file'])
-                else:
-                    webbrowser.open(f"file://{os.path.abspath(result['analysis_file'])}")
-            except Exception as e:
-                print(f"Error opening file: {str(e)}")
+        if interactive:
+            open_file = input("\nWould you like to open the full analysis file? (y/n): ").lower() == 'y'
+            if open_file:
+                try:
+                    if sys.platform == 'win32':
+                        os.startfile(result['analysis_file'])
+                    else:
+                        webbrowser.open(f"file://{os.path.abspath(result['analysis_file'])}")
+                except Exception as e:
+                    print(f"Error opening file: {str(e)}")
                 
     except Exception as e:
         print(f"Error showing analysis: {str(e)}")
     
     return result
 
+def ask_video_count(prompt):
+    """Ask how many videos to analyze, clamped to 1-10 (default 5)"""
+    try:
+        num_videos = int(input(prompt))
+        return max(1, min(10, num_videos))  # Ensure between 1 and 10
+    except ValueError:
+        print("Invalid number. Using default of 5 videos.")
+        return 5
+
+def read_script_text():
+    """Read a pasted script until a line containing only END (or end of input)"""
+    print("\nEnter your script (type 'END' on a new line when finished):")
+    
+    readline = sys.stdin.readline
+    script_lines = []
+    while True:
+        line = readline()
+        if not line or line.rstrip("\r\n") == "END":
+            break
+        script_lines.append(line)
+    
+    return "".join(script_lines).rstrip("\r\n")
+
 def get_niche():
     """Get niche from user"""
-    print("\nSelect content niche:")
-    print("1. Productivity")
-    print("2. Health & Fitness")
-    print("3. AI & Technology")
-    
-    niche_map = {
-        "1": "productivity",
-        "2": "health_fitness", 
-        "3": "ai_tech"
-    }
+    print(_NICHE_MENU)
     
     while True:
         choice = input("Enter your choice (1-3): ")
-        if choice in niche_map:
-            return niche_map[choice]
+        if choice in NICHE_MAP:
+            return NICHE_MAP[choice]
         print("Invalid choice. Please try again.")
 
 if __name__ == "__main__":
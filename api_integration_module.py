@@ -1,9 +1,148 @@
 import os
+import re
 import json
 import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
 from pathlib import Path
-from youtube_api_extractor import YouTubeAPIExtractor
-from competitor_analysis import CompetitorAnalyzer
+from youtube_api_extractor import ANALYSIS_LOOKUPS, YouTubeAPIExtractor
+from competitor_analysis import CompetitorAnalyzer, atomic_write
+from data_integration_module import DataIntegrationModule
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+log = logging.getLogger(__name__)
+
+# Number of videos fetched from the YouTube API at the same time
+MAX_WORKERS = 8
+# Video extractions started per second across all workers (each one makes several API calls)
+VIDEOS_PER_SECOND = 5
+# HTTP statuses the API uses for exhausted quota / rate limiting; they halve the pace
+RATE_LIMIT_STATUS_CODES = frozenset({403, 429})
+# Saved API analyses younger than this are reused instead of calling the API again
+ANALYSIS_CACHE_TTL = 24 * 60 * 60
+# How long search results are reused (in Redis when configured, otherwise in memory)
+NICHE_SEARCH_CACHE_TTL = 60 * 60
+CHANNEL_VIDEOS_CACHE_TTL = 10 * 60
+
+# Saved analyses are only read back by code, so they are written compact unless
+# YTO_PRETTY_JSON is set (e.g. when inspecting the files by hand)
+PRETTY_JSON = bool(os.environ.get('YTO_PRETTY_JSON'))
+
+# Title words that suggest personal content (and so a face in the thumbnail)
+PERSONAL_TITLE_WORDS = frozenset({"i", "me", "my"})
+# Niches where thumbnails usually show a face
+FACE_NICHES = frozenset({"health_fitness", "productivity"})
+_TITLE_WORD_RE = re.compile(r"[a-z]+")
+
+# YouTube search terms used to find top videos for each niche
+NICHE_SEARCH_TERMS = MappingProxyType({
+    "productivity": "productivity tips",
+    "health_fitness": "fitness workout",
+    "ai_tech": "AI technology tutorial"
+})
+
+# Thumbnail colors assumed until thumbnails are analyzed (shared, read-only; saved as a JSON list)
+DEFAULT_THUMBNAIL_COLORS = ("blue", "red", "white")
+
+# Pattern groups from the API extractor that are copied into the competitor database
+PATTERN_TYPES = frozenset({"title_patterns", "description_patterns", "engagement_patterns"})
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: acquire() blocks until a token is available
+    The rate adapts between min_rate and rate_per_sec via slow_down() and recover()
+    """
+    
+    def __init__(self, rate_per_sec, burst, min_rate=0.2):
+        self.rate_per_sec = rate_per_sec
+        self.max_rate = rate_per_sec
+        self.min_rate = min_rate
+        self.burst = burst
+        self._tokens = burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, sleeping until the bucket has refilled enough"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate_per_sec)
+                self._last = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                wait = (1 - self._tokens) / self.rate_per_sec
+            time.sleep(wait)
+    
+    def slow_down(self):
+        """Halve the rate after a rate-limit or quota error"""
+        with self._lock:
+            self.rate_per_sec = max(self.min_rate, self.rate_per_sec / 2)
+    
+    def recover(self):
+        """Raise the rate a step back towards its maximum after a successful call"""
+        with self._lock:
+            self.rate_per_sec = min(self.max_rate, self.rate_per_sec * 1.25)
+
+def _jsonable(obj):
+    """Convert values the JSON encoders can't handle natively (numpy scalars and odd arrays, sets)"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _write_json(path, obj, pretty=PRETTY_JSON):
+    """Write obj to path as JSON (compact unless pretty), using orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        data = orjson.dumps(obj, default=_jsonable, option=option)
+    else:
+        # Encode in one go: json.dump issues a write per token
+        if pretty:
+            data = json.dumps(obj, indent=2, default=_jsonable).encode('utf-8')
+        else:
+            data = json.dumps(obj, separators=(',', ':'), default=_jsonable).encode('utf-8')
+    
+    atomic_write(path, data)
+
+def _json_line(obj):
+    """Encode obj as a single line of compact JSON"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, default=_jsonable, option=option)
+    return json.dumps(obj, default=_jsonable).encode('utf-8') + b"\n"
+
+def _loads(data):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@lru_cache(maxsize=32)
+def _parse_analysis_file(path, mtime_ns):
+    """
+    Parse a saved analysis file (cached per path and modification time)
+    Only a few parsed analyses are kept; re-checking a path costs a stat call
+    """
+    return _loads(Path(path).read_bytes())
 
 class APIIntegrationModule:
     """
@@ -13,41 +152,76 @@ class APIIntegrationModule:
     - Enables accurate pattern recognition based on verified data
     """
     
-    def __init__(self, api_key):
-        self.api_extractor = YouTubeAPIExtractor(api_key)
+    def __init__(self, api_key, redis_url=None):
+        # Every batch worker can have all of one video's lookups in flight
+        self.api_extractor = YouTubeAPIExtractor(api_key, max_connections=MAX_WORKERS * ANALYSIS_LOOKUPS)
         self.competitor_analyzer = CompetitorAnalyzer()
         self.data_dir = Path("data")
         self.data_dir.mkdir(exist_ok=True)
+        # Serializes competitor database updates from concurrent workers
+        self._db_lock = threading.Lock()
+        # Paces video extractions to stay within the API quota
+        self.rate_limiter = TokenBucket(VIDEOS_PER_SECOND, VIDEOS_PER_SECOND)
+        self._data_integrator = None
+        # Search result cache: Redis when a URL is given (shared across runs), else per process
+        redis_url = redis_url or os.environ.get('YTO_REDIS_URL')
+        self.redis = None
+        if redis_url:
+            if redis is None:
+                log.warning("redis package not installed; caching search results in memory only")
+            else:
+                self.redis = redis.Redis.from_url(redis_url)
+        self._memory_cache = {}
+        self._memory_cache_lock = threading.Lock()
+    
+    @property
+    def data_integrator(self):
+        """DataIntegrationModule used for content DNA analysis (created on first use)"""
+        if self._data_integrator is None:
+            self._data_integrator = DataIntegrationModule()
+        return self._data_integrator
     
-    def extract_and_integrate(self, video_url, niche):
+    def extract_and_integrate(self, video_url, niche, force_refresh=False, prefetched=None, cached_analysis=None):
         """
         Extract data using the YouTube API and integrate it into the competitor database
+        A saved analysis younger than ANALYSIS_CACHE_TTL is reused unless force_refresh is set;
+        prefetched is an optional get_multiple_video_details entry for this video, and
+        cached_analysis a saved analysis the caller has already loaded
         """
-        print(f"Extracting data from {video_url} using YouTube API...")
-        
-        # Step 1: Extract all available data
-        analysis = self.api_extractor.get_complete_video_analysis(video_url)
+        # Step 1: Extract all available data (or reuse a recent analysis)
+        analysis = cached_analysis
+        if analysis is None and not force_refresh:
+            analysis = self._load_cached_analysis(video_url)
+        cached = analysis is not None
+        
+        if cached:
+            log.info("Using saved analysis for %s", video_url)
+        else:
+            log.info("Extracting data from %s using YouTube API...", video_url)
+            analysis = self.api_extractor.get_complete_video_analysis(video_url, details=prefetched)
         
         if not analysis.get('success', False):
-            print(f"Error extracting data: {analysis.get('error', 'Unknown error')}")
+            log.error("Error extracting data: %s", analysis.get('error', 'Unknown error'))
             return {
                 "success": False,
-                "error": analysis.get('error', 'Failed to extract video data')
+                "error": analysis.get('error', 'Failed to extract video data'),
+                "status_code": analysis.get('status_code')
             }
         
         # Step 2: Transform data into competitor format
         video_info = self._transform_to_competitor_format(analysis, niche)
         
         # Step 3: Add to competitor database
-        print(f"Adding video to {niche} database...")
-        result = self.competitor_analyzer.manual_add_video(video_info, niche)
+        log.info("Adding video to %s database...", niche)
+        with self._db_lock:
+            result = self.competitor_analyzer.manual_add_video(video_info, niche)
         
         # Step 4: Save full analysis separately
         video_id = analysis.get('video_id', 'unknown')
         analysis_file = self.data_dir / f"{video_id}_api_analysis.json"
         
-        with open(analysis_file, 'w', encoding='utf-8') as f:
-            json.dump(analysis, f, indent=4)
+        if not cached:
+            _write_json(analysis_file, analysis)
         
         return {
             "success": True,
@@ -57,6 +231,60 @@ class APIIntegrationModule:
             "enriched_data": video_info
         }
     
+    def _load_cached_analysis(self, video_url):
+        """Return the saved analysis for a video if it is recent enough, otherwise None"""
+        try:
+            video_id = self.api_extractor.extract_video_id(video_url)
+            analysis_file = self.data_dir / f"{video_id}_api_analysis.json"
+            mtime_ns = analysis_file.stat().st_mtime_ns
+            
+            if time.time() - mtime_ns / 1e9 >= ANALYSIS_CACHE_TTL:
+                return None
+            
+            return _parse_analysis_file(str(analysis_file), mtime_ns)
+        except (ValueError, KeyError, OSError):
+            # Unparseable URL, no saved analysis, or a corrupt file: fetch from the API
+            return None
+    
+    def _rate_limited_extract(self, video_url, niche, prefetched=None):
+        """Run extract_and_integrate, waiting for the rate limiter only when the video is fetched from the API"""
+        # One cache lookup decides both whether a token is needed and whether the API is called
+        cached_analysis = self._load_cached_analysis(video_url)
+        if cached_analysis is not None:
+            # A recent saved analysis is reused without any API call
+            return self.extract_and_integrate(video_url, niche, cached_analysis=cached_analysis)
+        
+        self.rate_limiter.acquire()
+        result = self.extract_and_integrate(video_url, niche, force_refresh=True, prefetched=prefetched)
+        
+        if result.get('status_code') in RATE_LIMIT_STATUS_CODES:
+            self.rate_limiter.slow_down()
+        elif result.get('success', False):
+            self.rate_limiter.recover()
+        
+        return result
+    
+    def _bulk_fetch_metadata(self, video_ids):
+        """
+        Fetch details for the videos that have no recent saved analysis, 50 IDs per request
+        Returns {video_id: details}; on failure returns {} so each video is fetched on its own
+        """
+        video_ids = [
+            video_id for video_id in video_ids
+            if video_id and self._load_cached_analysis(f"https://www.youtube.com/watch?v={video_id}") is None
+        ]
+        if not video_ids:
+            return {}
+        
+        try:
+            self.rate_limiter.acquire()
+            return self.api_extractor.get_multiple_video_details(video_ids)
+        except Exception as e:
+            log.error("Error fetching video details in bulk: %s", e)
+            if getattr(e, 'status_code', None) in RATE_LIMIT_STATUS_CODES:
+                self.rate_limiter.slow_down()
+            return {}
+    
     def _transform_to_competitor_format(self, analysis, niche):
         """Transform the API data into competitor analyzer format"""
         
@@ -67,25 +295,28 @@ class APIIntegrationModule:
         seo = metadata.get('seo', {})
         content_details = metadata.get('content_details', {})
         
-        # Extract transcript info
-        has_transcript = analysis.get('transcript_info', {}).get('transcript_available', False)
+        # Fields used more than once
+        title = basic_info.get('title', '')
+        view_count = engagement.get('view_count', 0)
+        like_count = engagement.get('like_count', 0)
+        comment_count = engagement.get('comment_count', 0)
         
         # Create thumbnail data (for now we have to estimate this without actual image analysis)
         thumbnail_data = {
-            "has_face": self._infer_face_presence(basic_info.get('title', ''), niche),
+            "has_face": self._infer_face_presence(title, niche),
             "has_text": True,  # Most YouTube thumbnails have text
-            "colors": ["blue", "red", "white"]  # Default colors
+            "colors": DEFAULT_THUMBNAIL_COLORS
         }
         
         # Create the transformed video info
         video_info = {
-            "title": basic_info.get('title', ''),
+            "title": title,
             "channel": basic_info.get('channel_name', ''),
             "url": analysis.get('video_url', ''),
             "video_id": analysis.get('video_id', ''),
-            "views": engagement.get('view_count', 0),
-            "likes": engagement.get('like_count', 0),
-            "comments": engagement.get('comment_count', 0),
+            "views": view_count,
+            "likes": like_count,
+            "comments": comment_count,
             "description": seo.get('description', ''),
             "thumbnail": thumbnail_data,
             "upload_date": basic_info.get('publish_date', ''),
@@ -100,20 +331,20 @@ class APIIntegrationModule:
         }
         
         # Add channel info if available
-        if 'channel_info' in metadata:
+        channel_info = metadata.get('channel_info')
+        if channel_info is not None:
             video_info["channel_data"] = {
-                "subscriber_count": metadata['channel_info'].get('subscriber_count', 0),
-                "video_count": metadata['channel_info'].get('video_count', 0),
-                "total_views": metadata['channel_info'].get('view_count', 0)
+                "subscriber_count": channel_info.get('subscriber_count', 0),
+                "video_count": channel_info.get('video_count', 0),
+                "total_views": channel_info.get('view_count', 0)
             }
         
         # Add engagement metrics
         if engagement:
             # Calculate engagement ratios
-            view_count = engagement.get('view_count', 0)
             if view_count > 0:
-                like_ratio = (engagement.get('like_count', 0) / view_count) * 100
-                comment_ratio = (engagement.get('comment_count', 0) / view_count) * 100
+                like_ratio = (like_count / view_count) * 100
+                comment_ratio = (comment_count / view_count) * 100
                 
                 video_info["engagement_metrics"] = {
                     "like_ratio": like_ratio,
@@ -122,18 +353,11 @@ class APIIntegrationModule:
         
         # Add patterns if available
         if 'patterns' in analysis:
-            patterns = analysis['patterns']
-            pattern_data = {}
-            
-            for pattern_type, pattern_list in patterns.items():
-                if pattern_type == "title_patterns":
-                    pattern_data["title_patterns"] = [p.get('pattern', '') for p in pattern_list]
-                elif pattern_type == "description_patterns":
-                    pattern_data["description_patterns"] = [p.get('pattern', '') for p in pattern_list]
-                elif pattern_type == "engagement_patterns":
-                    pattern_data["engagement_patterns"] = [p.get('pattern', '') for p in pattern_list]
-                    
-            video_info["detected_patterns"] = pattern_data
+            video_info["detected_patterns"] = {
+                pattern_type: [p.get('pattern', '') for p in pattern_list]
+                for pattern_type, pattern_list in analysis['patterns'].items()
+                if pattern_type in PATTERN_TYPES
+            }
         
         return video_info
     
@@ -141,72 +365,109 @@ class APIIntegrationModule:
         """Make an educated guess about face presence in thumbnail based on title and niche"""
         # This is a simple heuristic - in a real system, we would use the YouTube API to get the thumbnail
         # and then use image recognition to detect faces
-        personal_indicators = ["i ", "me", "my", "how i", "i tried"]
         
-        # Personal content often has faces
-        for indicator in personal_indicators:
-            if indicator in title.lower():
-                return True
-                
-        # Some niches have higher likelihood of faces
-        if niche in ["health_fitness", "productivity"]:
+        # Some niches have higher likelihood of faces (checked first: no title work needed)
+        if niche in FACE_NICHES:
             return True
-            
-        return False
+        
+        # Personal content often has faces (matched on whole words, so "home" is not "me")
+        return not PERSONAL_TITLE_WORDS.isdisjoint(_TITLE_WORD_RE.findall(title.lower()))
     
     def batch_extract_and_integrate(self, video_urls, niche):
         """Process a batch of videos using the YouTube API and add them to the competitor database"""
-        results = []
-        
-        for i, url in enumerate(video_urls):
-            print(f"Processing video {i+1}/{len(video_urls)}: {url}")
+        def process(numbered_url):
+            i, url = numbered_url
+            log.info("Processing video %d/%d: %s", i + 1, len(video_urls), url)
             
             try:
-                result = self.extract_and_integrate(url, niche)
-                results.append(result)
-                
-                # Be nice to the API quota
-                time.sleep(1)
-                
+                return self._rate_limited_extract(url, niche)
             except Exception as e:
-                print(f"Error processing {url}: {str(e)}")
-                results.append({
+                log.error("Error processing %s: %s", url, e)
+                return {
                     "success": False,
                     "video_url": url,
                     "error": str(e)
-                })
+                }
         
-        # Save batch summary
         summary_file = self.data_dir / f"api_batch_import_{niche}_{int(time.time())}.json"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                "niche": niche,
-                "processed_count": len(video_urls),
-                "success_count": sum(1 for r in results if r.get('success', False)),
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-                "results": results
-            }, f, indent=4)
+        results_file = summary_file.with_suffix('.jsonl')
+        succeeded = 0
+        
+        # Stream each result to the JSONL file as it completes (in the order of video_urls)
+        # instead of holding every result in memory; URLs are submitted a window at a time
+        # and the competitor database is written once per window
+        window = MAX_WORKERS * 4
+        with open(results_file, 'wb') as out, ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for start in range(0, len(video_urls), window):
+                numbered_urls = enumerate(video_urls[start:start + window], start)
+                with self.competitor_analyzer.deferred_save():
+                    for result in executor.map(process, numbered_urls):
+                        out.write(_json_line(result))
+                        if result.get('success', False):
+                            succeeded += 1
+        
+        # Save batch summary (per-video results are in results_file)
+        _write_json(summary_file, {
+            "niche": niche,
+            "processed_count": len(video_urls),
+            "success_count": succeeded,
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "results_file": str(results_file)
+        })
         
         return {
             "success": True,
             "processed": len(video_urls),
-            "succeeded": sum(1 for r in results if r.get('success', False)),
+            "succeeded": succeeded,
             "summary_file": str(summary_file),
-            "results": results
+            "results_file": str(results_file)
         }
     
-    def get_top_videos_in_niche(self, niche, max_results=10):
-        """Get top videos in a specific niche to analyze"""
-        # Map niches to YouTube search terms
-        niche_mapping = {
-            "productivity": "productivity tips",
-            "health_fitness": "fitness workout",
-            "ai_tech": "AI technology tutorial"
-        }
+    def _cached_json(self, key, ttl, fn, *args):
+        """
+        Return fn(*args), reusing a successful result for ttl seconds
+        Results live in Redis when it is configured, otherwise in this process
+        """
+        if self.redis is not None:
+            try:
+                cached = self.redis.get(key)
+                if cached is not None:
+                    return _loads(cached)
+            except redis.RedisError as e:
+                log.warning("Redis cache unavailable: %s", e)
+        else:
+            with self._memory_cache_lock:
+                entry = self._memory_cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+        
+        result = fn(*args)
+        if not result.get('success', False):
+            return result
         
-        search_term = niche_mapping.get(niche, niche)
+        if self.redis is not None:
+            try:
+                self.redis.setex(key, ttl, _json_line(result))
+            except redis.RedisError as e:
+                log.warning("Redis cache unavailable: %s", e)
+        else:
+            with self._memory_cache_lock:
+                self._memory_cache[key] = (time.monotonic() + ttl, result)
+        
+        return result
+    
+    def get_top_videos_in_niche(self, niche, max_results=10):
+        """Get top videos in a specific niche to analyze (cached for NICHE_SEARCH_CACHE_TTL)"""
+        return self._cached_json(
+            f"yto:niche:{niche}:{max_results}", NICHE_SEARCH_CACHE_TTL,
+            self._get_top_videos_in_niche, niche, max_results
+        )
+    
+    def _get_top_videos_in_niche(self, niche, max_results):
+        """Search the YouTube API for top videos in a niche"""
+        search_term = NICHE_SEARCH_TERMS.get(niche, niche)
         
-        print(f"Finding top videos for '{search_term}'...")
+        log.info("Finding top videos for '%s'...", search_term)
         result = self.api_extractor.get_top_videos_in_category(search_term, max_results=max_results)
         
         if not result.get('success', False):
@@ -226,7 +487,7 @@ class APIIntegrationModule:
     
     def analyze_niche_with_top_videos(self, niche, max_videos=5):
         """Find and analyze top videos in a niche automatically"""
-        print(f"Analyzing top videos in the {niche} niche...")
+        log.info("Analyzing top videos in the %s niche...", niche)
         
         # Step 1: Find top videos
         top_videos = self.get_top_videos_in_niche(niche, max_results=max_videos)
@@ -244,35 +505,18 @@ class APIIntegrationModule:
                 "error": "No videos found in this niche"
             }
         
-        # Step 2: Process each video
+        # Step 2: Process the videos concurrently
         processed_videos = []
-        for video in videos:
-            video_id = video.get('video_id', '')
-            if video_id:
-                video_url = f"https://www.youtube.com/watch?v={video_id}"
-                
-                try:
-                    print(f"Processing video: {video.get('title', video_id)}")
-                    result = self.extract_and_integrate(video_url, niche)
-                    
-                    if result.get('success', False):
-                        processed_videos.append({
-                            "video_id": video_id,
-                            "title": video.get('title', ''),
-                            "view_count": video.get('view_count', 0),
-                            "analysis_file": result.get('analysis_file', '')
-                        })
-                    
-                    # Be nice to the API quota
-                    time.sleep(2)
-                    
-                except Exception as e:
-                    print(f"Error processing video {video_id}: {str(e)}")
+        for video, result in self._extract_videos_concurrently(videos, niche):
+            processed_videos.append({
+                "video_id": video['video_id'],
+                "title": video.get('title', ''),
+                "view_count": video.get('view_count', 0),
+                "analysis_file": result.get('analysis_file', '')
+            })
         
         # Step 3: Run enhanced analysis
-        from data_integration_module import DataIntegrationModule
-        data_integrator = DataIntegrationModule()
-        analysis_result = data_integrator.run_enhanced_analysis(niche)
+        analysis_result = self.data_integrator.run_enhanced_analysis(niche)
         
         return {
             "success": True,
@@ -282,8 +526,46 @@ class APIIntegrationModule:
             "analysis_file": analysis_result.get('analysis_file', '') if analysis_result.get('success', False) else ''
         }
     
+    def _extract_videos_concurrently(self, videos, niche):
+        """
+        Run extract_and_integrate for a list of videos on a small thread pool
+        Returns (video, result) pairs for the videos that were processed successfully
+        """
+        # One videos.list/channels.list round-trip for the whole list instead of one per video
+        details = self._bulk_fetch_metadata([video.get('video_id', '') for video in videos])
+        
+        def process(video):
+            video_id = video.get('video_id', '')
+            if not video_id:
+                return None
+            
+            try:
+                log.info("Processing video: %s", video.get('title', video_id))
+                return self._rate_limited_extract(
+                    f"https://www.youtube.com/watch?v={video_id}", niche, prefetched=details.get(video_id)
+                )
+            except Exception as e:
+                log.error("Error processing video %s: %s", video_id, e)
+                return None
+        
+        # Save the competitor database once for the whole list
+        with self.competitor_analyzer.deferred_save(), ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = list(executor.map(process, videos))
+        
+        return [
+            (video, result) for video, result in zip(videos, results)
+            if result and result.get('success', False)
+        ]
+    
     def find_channel_videos(self, channel_id, max_results=10):
-        """Find videos from a specific channel"""
+        """Find videos from a specific channel (cached for CHANNEL_VIDEOS_CACHE_TTL)"""
+        return self._cached_json(
+            f"yto:channel:{channel_id}:{max_results}", CHANNEL_VIDEOS_CACHE_TTL,
+            self._find_channel_videos, channel_id, max_results
+        )
+    
+    def _find_channel_videos(self, channel_id, max_results):
+        """Search the YouTube API for a channel's latest videos"""
         try:
             # Make API request to get channel uploads
             videos_response = self.api_extractor._make_api_request(
@@ -329,7 +611,7 @@ class APIIntegrationModule:
     
     def analyze_successful_channel(self, channel_id, niche, max_videos=5):
         """Analyze videos from a successful channel in your niche"""
-        print(f"Analyzing top videos from channel {channel_id}...")
+        log.info("Analyzing top videos from channel %s...", channel_id)
         
         # Step 1: Get channel videos
         channel_videos = self.find_channel_videos(channel_id, max_results=max_videos)
@@ -347,29 +629,14 @@ class APIIntegrationModule:
                 "error": "No videos found for this channel"
             }
         
-        # Step 2: Process each video
+        # Step 2: Process the videos concurrently
         processed_videos = []
-        for video in videos:
-            video_id = video.get('video_id', '')
-            if video_id:
-                video_url = f"https://www.youtube.com/watch?v={video_id}"
-                
-                try:
-                    print(f"Processing video: {video.get('title', video_id)}")
-                    result = self.extract_and_integrate(video_url, niche)
-                    
-                    if result.get('success', False):
-                        processed_videos.append({
-                            "video_id": video_id,
-                            "title": video.get('title', ''),
-                            "analysis_file": result.get('analysis_file', '')
-                        })
-                    
-                    # Be nice to the API quota
-                    time.sleep(2)
-                    
-                except Exception as e:
-                    print(f"Error processing video {video_id}: {str(e)}")
+        for video, result in self._extract_videos_concurrently(videos, niche):
+            processed_videos.append({
+                "video_id": video['video_id'],
+                "title": video.get('title', ''),
+                "analysis_file": result.get('analysis_file', '')
+            })
         
         return {
             "success": True,
@@ -380,15 +647,14 @@ class APIIntegrationModule:
     
     def run_content_dna_analysis(self, niche):
         """Run enhanced content DNA analysis"""
-        from data_integration_module import DataIntegrationModule
-        data_integrator = DataIntegrationModule()
-        return data_integrator.run_enhanced_analysis(niche)
+        return self.data_integrator.run_enhanced_analysis(niche)
 
 # Example usage
 if __name__ == "__main__":
     # Replace with your actual API key
     API_KEY = "YOUR_API_KEY_HERE"
     
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     integrator = APIIntegrationModule(API_KEY)
     
     # Example: Analyze top videos in a niche
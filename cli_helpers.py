@@ -0,0 +1,55 @@
+import sys
+
+# Piped input (e.g. a script fed on stdin) is read with a bound readline instead of input(),
+# without echoing prompts
+_INTERACTIVE = sys.stdin.isatty()
+_readline = sys.stdin.readline
+
+NICHE_MAP = {
+    "1": "productivity",
+    "2": "health_fitness",
+    "3": "ai_tech"
+}
+
+def ask(prompt):
+    """Read one line of user input, showing the prompt only to an interactive user"""
+    if _INTERACTIVE:
+        return input(prompt)
+
+    line = _readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+def read_line():
+    """Read one line of input without its newline, or None at end of input"""
+    if _INTERACTIVE:
+        try:
+            return input()
+        except EOFError:
+            return None
+
+    line = _readline()
+    return line.rstrip("\n") if line else None
+
+def to_int(text, default=None):
+    """Parse an entered whole number, returning default when it is blank or invalid"""
+    try:
+        return int(text) if text else default
+    except ValueError:
+        return default
+
+def to_float(text, default=None):
+    """Parse an entered decimal number, returning default when it is blank or invalid"""
+    try:
+        return float(text) if text else default
+    except ValueError:
+        return default
+
+def is_yes(answer):
+    """True for a y/n answer starting with 'y' (any case)"""
+    return answer[:1].lower() == "y"
+
+def print_lines(lines):
+    """Print a block of lines with a single write"""
+    sys.stdout.write("\n".join(lines) + "\n")
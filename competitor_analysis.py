@@ -1,23 +1,147 @@
 import os
+import sys
 import json
 import re
 import requests
-from collections import Counter
+import functools
+from collections import Counter, defaultdict
 import numpy as np
 from datetime import datetime
 import csv
 import time
+import itertools
+import threading
+from contextlib import contextmanager
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Words counted for title word frequency
+_WORD_RE = re.compile(r'\b[a-z]{3,15}\b')
+# Title words that mark a "you focused" title
+_YOU_WORDS = frozenset(("you", "your"))
+
+# Thumbnail composition by has_face * 2 + has_text
+_THUMBNAIL_COMPOSITIONS = ("object_only", "text_only", "face_only", "face_and_text")
+
+COMPETITOR_DB_FILE = 'competitor_database.json'
+# Small niche -> video count summary of competitor_database.json
+COMPETITOR_INDEX_FILE = 'competitor_database.index.json'
+# Read buffer for competitor CSV imports
+CSV_READ_BUFFER = 1 << 20
+
+def parse_thumbnail_colors(text):
+    """Split a comma-separated color list into lowercase names, skipping blanks"""
+    colors = []
+    for color in text.lower().split(','):
+        color = color.strip()
+        if color:
+            # Interned so the many repeats of "red" or "black" share one string
+            colors.append(sys.intern(color))
+    return colors
+
+def is_error(result):
+    """True when an analyzer result dict reports an error status"""
+    return result.get("status") == "error"
+
+def _intern_text(value):
+    """Intern a CSV cell value (cells missing from a short row stay None)"""
+    return value if value is None else sys.intern(value)
+
+# CSV columns copied into every video: (key, converter or None for text, value when the column is missing).
+# Channel names repeat across rows, so they are interned like thumbnail colors.
+_CSV_FIELDS = (
+    ("channel", _intern_text, ''),
+    ("views", int, 0),
+    ("likes", int, 0),
+    ("comments", int, 0),
+    ("description", None, ''),
+    ("transcript", None, ''),
+)
+# CSV columns only copied when the file has them: (key, converter or None for text)
+_CSV_OPTIONAL_FIELDS = (
+    ("ctr", float),
+    ("retention", float),
+    ("upload_date", None),
+)
+
+def _write_database(competitor_data):
+    """Write the competitor database to a temporary file and swap it into place"""
+    if orjson is not None:
+        data = orjson.dumps(competitor_data, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(competitor_data, indent=2).encode('utf-8')
+    atomic_write(COMPETITOR_DB_FILE, data)
+
+def atomic_write(path, data):
+    """Write bytes to a temporary sibling of path and swap it into place"""
+    # Readers never see a half-written file, even if the process dies mid-write;
+    # the temp name is unique per process and thread, so concurrent writers never share it
+    tmp = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+def _cached_per_niche(method):
+    """Cache an analyzer's result for a niche until videos are added to that niche"""
+    @functools.wraps(method)
+    def wrapper(self, niche):
+        key = (method.__name__, niche)
+        version = self._niche_version[niche]
+        cached = self._analysis_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        result = method(self, niche)
+        self._analysis_cache[key] = (version, result)
+        return result
+    return wrapper
+
+def _is_listicle(title):
+    """Whether a title starts with a number followed by whitespace ("7 Ways to ...")"""
+    i = 0
+    length = len(title)
+    while i < length and title[i].isdecimal():
+        i += 1
+    return 0 < i < length and title[i].isspace()
+
+def _retention_bucket_label(index):
+    """Label of a 10% retention bucket, e.g. 3 -> '30%-40%'"""
+    return f"{index * 10}%-{index * 10 + 10}%"
+
+def _split_mean(values, mask):
+    """Mean of values where mask is set and where it is not (0 for an empty side)"""
+    hit_values = values[mask]
+    miss_values = values[~mask]
+    
+    mean_hit = float(hit_values.mean()) if hit_values.size else 0
+    mean_miss = float(miss_values.mean()) if miss_values.size else 0
+    return mean_hit, mean_miss
 
 class CompetitorAnalyzer:
     def __init__(self, youtube_api_key=None):
         self.youtube_api_key = youtube_api_key
         self.competitor_data = self.load_competitor_data()
+        # Nesting depth of deferred_save() blocks and whether an add is waiting to be saved
+        self._defer_save_depth = 0
+        self._save_pending = False
+        # Per-niche change counters; analyzer results are cached against them
+        self._niche_version = defaultdict(int)
+        self._analysis_cache = {}
         
     def load_competitor_data(self):
         """Load existing competitor data or create new database"""
         try:
-            with open('competitor_database.json', 'r') as f:
-                return json.load(f)
+            with open(COMPETITOR_DB_FILE, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
         except FileNotFoundError:
             # Create empty database structure
             initial_db = {
@@ -27,15 +151,44 @@ class CompetitorAnalyzer:
             }
             
             # Save the initial database
-            with open('competitor_database.json', 'w') as f:
-                json.dump(initial_db, f, indent=4)
+            _write_database(initial_db)
+            self.save_competitor_index(initial_db)
             
             return initial_db
     
     def save_competitor_data(self):
         """Save the updated competitor database"""
-        with open('competitor_database.json', 'w') as f:
-            json.dump(self.competitor_data, f, indent=4)
+        _write_database(self.competitor_data)
+        self.save_competitor_index(self.competitor_data)
+    
+    def save_competitor_index(self, competitor_data):
+        """Save the per-niche video counts next to the database"""
+        # Written after the database so its mtime marks the index as current
+        counts = {niche: len(videos) for niche, videos in competitor_data.items()}
+        atomic_write(COMPETITOR_INDEX_FILE, json.dumps(counts).encode('utf-8'))
+    
+    @contextmanager
+    def deferred_save(self):
+        """Write the database once at the end of the block instead of after every add"""
+        self._defer_save_depth += 1
+        try:
+            yield self
+        finally:
+            self._defer_save_depth -= 1
+            if self._defer_save_depth == 0 and self._save_pending:
+                self._save_pending = False
+                self.save_competitor_data()
+    
+    def _save_or_defer(self):
+        """Save the database now, or at the end of the enclosing deferred_save() block"""
+        if self._defer_save_depth:
+            self._save_pending = True
+        else:
+            self.save_competitor_data()
+    
+    def count(self, niche):
+        """Number of videos stored for a niche"""
+        return len(self.competitor_data.get(niche, ()))
     
     def manual_add_video(self, video_info, niche):
         """Manually add a video to the database"""
@@ -47,72 +200,134 @@ class CompetitorAnalyzer:
         
         # Add to database
         self.competitor_data[niche].append(video_info)
-        self.save_competitor_data()
+        self._niche_version[niche] += 1
+        self._save_or_defer()
         
         return {"status": "success", "message": f"Video '{video_info['title']}' added to {niche} database"}
     
-    def bulk_add_from_csv(self, csv_file, niche):
-        """Add multiple videos from a CSV file"""
+    def bulk_add_from_csv(self, csv_file, niche, max_rows=None):
+        """Add multiple videos from a CSV file (at most max_rows of them if given)"""
         if niche not in self.competitor_data:
             return {"status": "error", "message": f"Niche {niche} not found in database"}
             
         added_count = 0
         try:
-            with open(csv_file, 'r', encoding='utf-8') as f:
-                csv_reader = csv.DictReader(f)
-                for row in csv_reader:
-                    # Check for required fields
-                    if 'title' not in row or 'url' not in row:
-                        continue
-                        
-                    # Create video info object
-                    video_info = {
-                        "title": row['title'],
-                        "url": row['url'],
-                        "channel": row.get('channel', ''),
-                        "views": int(row.get('views', 0)),
-                        "likes": int(row.get('likes', 0)),
-                        "comments": int(row.get('comments', 0)),
-                        "description": row.get('description', ''),
-                        "transcript": row.get('transcript', ''),
-                        "date_added": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    }
-                    
-                    # Add metrics if available
-                    if 'ctr' in row:
-                        video_info["ctr"] = float(row['ctr'])
-                    if 'retention' in row:
-                        video_info["retention"] = float(row['retention'])
-                    if 'upload_date' in row:
-                        video_info["upload_date"] = row['upload_date']
-                        
-                    # Add thumbnail info if available
-                    if 'thumbnail_colors' in row:
-                        video_info["thumbnail"] = {
-                            "colors": row['thumbnail_colors'].split(','),
-                            "has_face": row.get('thumbnail_has_face', '').lower() == 'true',
-                            "has_text": row.get('thumbnail_has_text', '').lower() == 'true'
-                        }
-                    
+            # Rows are streamed from a large read buffer rather than loaded up front
+            with open(csv_file, 'r', encoding='utf-8', newline='', buffering=CSV_READ_BUFFER) as f:
+                for video_info in itertools.islice(self._read_csv_videos(f), max_rows):
                     # Add to database
                     self.competitor_data[niche].append(video_info)
                     added_count += 1
                     
-            # Save updated database
-            self.save_competitor_data()
+            # Save updated database (once, after the last row)
+            self._save_or_defer()
             
             return {"status": "success", "message": f"Added {added_count} videos to {niche} database"}
             
+        except FileNotFoundError:
+            return {"status": "error", "message": f"File not found at {csv_file}"}
         except Exception as e:
             return {"status": "error", "message": f"Error adding videos from CSV: {str(e)}"}
+        finally:
+            # One version bump per import; rows appended before a failure count too
+            if added_count:
+                self._niche_version[niche] += 1
+    
+    def _read_csv_videos(self, f):
+        """Yield a video info dict for each data row of a competitor CSV file"""
+        csv_reader = csv.reader(f)
+        header = next(csv_reader, [])
+        
+        # Resolve column positions once instead of building a dict per row
+        columns = {name: i for i, name in enumerate(header)}
+        width = len(header)
+        
+        # Check for required fields
+        if 'title' not in columns or 'url' not in columns:
+            return
+        
+        def field(row, name, default=''):
+            i = columns.get(name)
+            return default if i is None else row[i]
+        
+        title_i = columns['title']
+        url_i = columns['url']
+        # (key, column index or None, converter, default) for every typed field
+        fields = [(key, columns.get(key), convert, default) for key, convert, default in _CSV_FIELDS]
+        optional_fields = [(key, columns[key], convert) for key, convert in _CSV_OPTIONAL_FIELDS if key in columns]
+        has_thumbnail = 'thumbnail_colors' in columns
+        # All rows of one import share the import time
+        date_added = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+        for row in csv_reader:
+            if not row:
+                continue
+            if len(row) < width:
+                # Missing trailing cells read as None, like csv.DictReader
+                row += [None] * (width - len(row))
+                
+            # Create video info object
+            video_info = {"title": row[title_i], "url": row[url_i]}
+            for key, i, convert, default in fields:
+                if i is None:
+                    video_info[key] = default
+                elif convert is None:
+                    video_info[key] = row[i]
+                else:
+                    video_info[key] = convert(row[i])
+            video_info["date_added"] = date_added
+            
+            # Add metrics if available
+            for key, i, convert in optional_fields:
+                video_info[key] = row[i] if convert is None else convert(row[i])
+                
+            # Add thumbnail info if available
+            if has_thumbnail:
+                video_info["thumbnail"] = {
+                    "colors": parse_thumbnail_colors(field(row, 'thumbnail_colors')),
+                    "has_face": field(row, 'thumbnail_has_face').lower() == 'true',
+                    "has_text": field(row, 'thumbnail_has_text').lower() == 'true'
+                }
+            
+            yield video_info
+    
+    @_cached_per_niche
+    def _niche_columns(self, niche):
+        """Column arrays of the per-video fields the analyzers reduce over"""
+        videos = self.competitor_data[niche]
+        count = len(videos)
+        has_ctr = np.zeros(count, dtype=bool)
+        ctr = np.zeros(count, dtype=np.float64)
+        has_thumbnail = np.zeros(count, dtype=bool)
+        has_face = np.zeros(count, dtype=bool)
+        has_text = np.zeros(count, dtype=bool)
+        
+        # One walk over the video dicts; analyzers then work on masks over these arrays
+        for i, video in enumerate(videos):
+            if "ctr" in video:
+                has_ctr[i] = True
+                ctr[i] = video["ctr"]
+            if "thumbnail" in video:
+                thumbnail = video["thumbnail"]
+                has_thumbnail[i] = True
+                has_face[i] = bool(thumbnail.get("has_face", False))
+                has_text[i] = bool(thumbnail.get("has_text", False))
+                
+        return {
+            "has_ctr": has_ctr,
+            "ctr": ctr,
+            "has_thumbnail": has_thumbnail,
+            "has_face": has_face,
+            "has_text": has_text
+        }
     
+    @_cached_per_niche
     def analyze_title_patterns(self, niche):
         """Analyze title patterns in the given niche"""
         if niche not in self.competitor_data or not self.competitor_data[niche]:
             return {"status": "error", "message": f"No data available for niche {niche}"}
             
-        # Get all titles
-        titles = [video["title"] for video in self.competitor_data[niche]]
+        videos = self.competitor_data[niche]
         
         # Pattern analysis - basic templates
         patterns = {
@@ -124,44 +339,57 @@ class CompetitorAnalyzer:
             "you_focused": 0
         }
         
-        # Word count analysis
-        word_counts = [len(title.split()) for title in titles]
-        avg_word_count = sum(word_counts) / max(len(word_counts), 1)
-        
-        # Common patterns
-        for title in titles:
-            title_lower = title.lower()
-            if title_lower.startswith("how to") or title_lower.startswith("how i"):
+        # Word counts, pattern counts and the how-to CTR sums are all collected
+        # in one pass over the videos
+        word_counts = []
+        ctr_count = 0
+        howto_ctr_sum = 0
+        howto_ctr_count = 0
+        other_ctr_sum = 0
+        word_freq = Counter()
+        
+        for video in videos:
+            title_lower = video["title"].lower()
+            words = title_lower.split()
+            word_counts.append(len(words))
+            word_freq.update(_WORD_RE.findall(title_lower))
+            
+            if title_lower.startswith(("how to", "how i")):
                 patterns["how_to"] += 1
-            elif re.match(r'^\d+\s', title_lower) or "ways to" in title_lower or "tips for" in title_lower:
+            elif _is_listicle(title_lower) or "ways to" in title_lower or "tips for" in title_lower:
                 patterns["listicle"] += 1
-            elif title_lower.endswith("?") or title_lower.startswith("why") or title_lower.startswith("what"):
+            elif title_lower.endswith("?") or title_lower.startswith(("why", "what")):
                 patterns["question"] += 1
             if title_lower.startswith("i ") or "i tried" in title_lower or "i tested" in title_lower:
                 patterns["i_personal"] += 1
-            if "you" in title_lower.split() or "your" in title_lower.split():
+            if not _YOU_WORDS.isdisjoint(words):
                 patterns["you_focused"] += 1
+            
+            if "ctr" in video:
+                ctr = video["ctr"]
+                ctr_count += 1
+                # Compare "how to" vs other formats for CTR
+                if title_lower.startswith("how to"):
+                    howto_ctr_sum += ctr
+                    howto_ctr_count += 1
+                else:
+                    other_ctr_sum += ctr
+        
+        total_videos = len(videos)
+        word_counts = np.array(word_counts, dtype=np.int32)
+        avg_word_count = float(word_counts.mean())
                 
         # Calculate percentages
-        total_videos = len(titles)
         pattern_percentages = {k: (v / total_videos * 100) for k, v in patterns.items()}
         
         # Common words analysis
-        all_words = " ".join(titles).lower()
-        word_list = re.findall(r'\b[a-z]{3,15}\b', all_words)
-        word_freq = Counter(word_list)
         common_words = word_freq.most_common(20)
         
         # Performance correlation if available
         performance_correlation = {}
-        videos_with_ctr = [v for v in self.competitor_data[niche] if "ctr" in v]
-        if videos_with_ctr:
-            # Compare "how to" vs other formats for CTR
-            how_to_videos = [v for v in videos_with_ctr if v["title"].lower().startswith("how to")]
-            other_videos = [v for v in videos_with_ctr if not v["title"].lower().startswith("how to")]
-            
-            avg_howto_ctr = sum(v["ctr"] for v in how_to_videos) / max(len(how_to_videos), 1)
-            avg_other_ctr = sum(v["ctr"] for v in other_videos) / max(len(other_videos), 1)
+        if ctr_count:
+            avg_howto_ctr = howto_ctr_sum / max(howto_ctr_count, 1)
+            avg_other_ctr = other_ctr_sum / max(ctr_count - howto_ctr_count, 1)
             
             performance_correlation["how_to_vs_other_ctr"] = {
                 "how_to_avg_ctr": avg_howto_ctr,
@@ -169,12 +397,17 @@ class CompetitorAnalyzer:
                 "difference": avg_howto_ctr - avg_other_ctr
             }
             
-            # Word count vs CTR correlation
+            # Word count vs CTR correlation: CTR sums and video counts per word count
+            columns = self._niche_columns(niche)
+            has_ctr = columns["has_ctr"]
+            ctr_word_counts = word_counts[has_ctr]
+            word_count_ctr_sum = np.bincount(ctr_word_counts, weights=columns["ctr"][has_ctr], minlength=15)
+            word_count_ctr_count = np.bincount(ctr_word_counts, minlength=15)
+            
             word_count_correlation = []
             for wc in range(3, 15):  # Analyze titles with 3-15 words
-                matches = [v for v in videos_with_ctr if len(v["title"].split()) == wc]
-                if matches:
-                    avg_ctr = sum(v["ctr"] for v in matches) / len(matches)
+                if word_count_ctr_count[wc]:
+                    avg_ctr = float(word_count_ctr_sum[wc] / word_count_ctr_count[wc])
                     word_count_correlation.append({"word_count": wc, "avg_ctr": avg_ctr})
                     
             performance_correlation["word_count_correlation"] = word_count_correlation
@@ -238,46 +471,48 @@ class CompetitorAnalyzer:
             
         return recommendations
     
+    @_cached_per_niche
     def analyze_thumbnail_patterns(self, niche):
         """Analyze thumbnail patterns in the given niche"""
         if niche not in self.competitor_data or not self.competitor_data[niche]:
             return {"status": "error", "message": f"No data available for niche {niche}"}
             
-        # Filter videos with thumbnail data
-        videos_with_thumbnail = [v for v in self.competitor_data[niche] if "thumbnail" in v]
-        if not videos_with_thumbnail:
-            return {"status": "error", "message": "No thumbnail data available for analysis"}
-            
+        columns = self._niche_columns(niche)
+        has_thumbnail = columns["has_thumbnail"]
+        
         # Analyze patterns
-        total_thumbnails = len(videos_with_thumbnail)
+        total_thumbnails = int(np.count_nonzero(has_thumbnail))
+        if not total_thumbnails:
+            return {"status": "error", "message": "No thumbnail data available for analysis"}
         
-        # Face presence analysis
-        faces_count = sum(1 for v in videos_with_thumbnail if v["thumbnail"].get("has_face", False))
+        # Face presence analysis (the flags are False for videos without a thumbnail)
+        faces_count = int(np.count_nonzero(columns["has_face"]))
         faces_percentage = (faces_count / total_thumbnails) * 100
         
         # Text presence analysis
-        text_count = sum(1 for v in videos_with_thumbnail if v["thumbnail"].get("has_text", False))
+        text_count = int(np.count_nonzero(columns["has_text"]))
         text_percentage = (text_count / total_thumbnails) * 100
         
         # Color analysis
-        all_colors = []
-        for v in videos_with_thumbnail:
-            if "colors" in v["thumbnail"]:
-                all_colors.extend(v["thumbnail"]["colors"])
-                
-        color_freq = Counter(all_colors)
+        color_freq = Counter(
+            color
+            for v in self.competitor_data[niche]
+            if "thumbnail" in v
+            for color in v["thumbnail"].get("colors", ())
+        )
         common_colors = color_freq.most_common(5)
         
         # Performance correlation if available
         performance_correlation = {}
-        videos_with_ctr = [v for v in videos_with_thumbnail if "ctr" in v]
-        if videos_with_ctr:
-            # Face vs no face CTR
-            face_videos = [v for v in videos_with_ctr if v["thumbnail"].get("has_face", False)]
-            no_face_videos = [v for v in videos_with_ctr if not v["thumbnail"].get("has_face", False)]
+        with_ctr = has_thumbnail & columns["has_ctr"]
+        if with_ctr.any():
+            # One CTR array plus boolean masks; every average below is a masked mean
+            ctr = columns["ctr"][with_ctr]
+            has_face = columns["has_face"][with_ctr]
+            has_text = columns["has_text"][with_ctr]
             
-            avg_face_ctr = sum(v["ctr"] for v in face_videos) / max(len(face_videos), 1)
-            avg_no_face_ctr = sum(v["ctr"] for v in no_face_videos) / max(len(no_face_videos), 1)
+            # Face vs no face CTR
+            avg_face_ctr, avg_no_face_ctr = _split_mean(ctr, has_face)
             
             performance_correlation["face_vs_no_face_ctr"] = {
                 "face_avg_ctr": avg_face_ctr,
@@ -286,11 +521,7 @@ class CompetitorAnalyzer:
             }
             
             # Text vs no text CTR
-            text_videos = [v for v in videos_with_ctr if v["thumbnail"].get("has_text", False)]
-            no_text_videos = [v for v in videos_with_ctr if not v["thumbnail"].get("has_text", False)]
-            
-            avg_text_ctr = sum(v["ctr"] for v in text_videos) / max(len(text_videos), 1)
-            avg_no_text_ctr = sum(v["ctr"] for v in no_text_videos) / max(len(no_text_videos), 1)
+            avg_text_ctr, avg_no_text_ctr = _split_mean(ctr, has_text)
             
             performance_correlation["text_vs_no_text_ctr"] = {
                 "text_avg_ctr": avg_text_ctr,
@@ -368,6 +599,7 @@ class CompetitorAnalyzer:
                 
         return recommendations
     
+    @_cached_per_niche
     def analyze_retention_patterns(self, niche):
         """Analyze retention patterns in the given niche"""
         if niche not in self.competitor_data or not self.competitor_data[niche]:
@@ -379,30 +611,31 @@ class CompetitorAnalyzer:
             return {"status": "error", "message": "No retention data available for analysis"}
             
         # Analyze common retention patterns
-        all_drop_points = []
-        for video in videos_with_retention:
-            for point in video["retention_points"]:
-                if point["type"] == "drop" and "position_percent" in point:
-                    all_drop_points.append(point["position_percent"])
+        positions = np.fromiter(
+            (point["position_percent"]
+             for video in videos_with_retention
+             for point in video["retention_points"]
+             if point["type"] == "drop" and "position_percent" in point),
+            dtype=np.int64
+        )
                     
-        # Count frequency in 10% buckets
-        buckets = {}
-        for i in range(0, 100, 10):
-            bucket_name = f"{i}%-{i+10}%"
-            buckets[bucket_name] = 0
-            
-        for point in all_drop_points:
-            bucket_index = (point // 10) * 10
-            bucket_name = f"{bucket_index}%-{bucket_index+10}%"
-            buckets[bucket_name] = buckets.get(bucket_name, 0) + 1
+        # Count frequency in 10% buckets (labels are only built for the output)
+        histogram = np.bincount(positions // 10, minlength=10)
+        buckets = {
+            _retention_bucket_label(i): int(count)
+            for i, count in enumerate(histogram)
+            if i < 10 or count
+        }
             
-        # Find significant drop points (peaks in the histogram)
-        sorted_buckets = sorted(buckets.items(), key=lambda x: x[1], reverse=True)
+        # Find significant drop points (peaks in the histogram); a stable sort keeps
+        # the earliest bucket first when counts tie
+        peak_indices = np.argsort(-histogram, kind='stable')[:2]
         
         # Generate recommendations
         recommendations = []
-        if sorted_buckets:
-            worst_bucket = sorted_buckets[0][0]
+        if len(peak_indices):
+            worst_index = int(peak_indices[0])
+            worst_bucket = _retention_bucket_label(worst_index)
             recommendations.append({
                 "type": "retention_risk",
                 "recommendation": f"Pay special attention to content during {worst_bucket}",
@@ -415,8 +648,7 @@ class CompetitorAnalyzer:
                 # Analyze what successful videos do at critical points
                 retention_strategies = []
                 for video in videos_with_script:
-                    worst_bucket_start = int(worst_bucket.split("%")[0])
-                    script_section = video["script_analysis"].get(f"section_{worst_bucket_start//10}", "")
+                    script_section = video["script_analysis"].get(f"section_{worst_index}", "")
                     if script_section:
                         retention_strategies.append(script_section["content_type"])
                         
@@ -431,11 +663,12 @@ class CompetitorAnalyzer:
         
         return {
             "videos_analyzed": len(videos_with_retention),
-            "drop_off_pattern": dict(sorted(buckets.items(), key=lambda x: int(x[0].split("%")[0]))),
-            "critical_sections": [bucket for bucket, count in sorted_buckets[:2]],
+            "drop_off_pattern": buckets,
+            "critical_sections": [_retention_bucket_label(int(i)) for i in peak_indices],
             "recommendations": recommendations
         }
     
+    @_cached_per_niche
     def get_pattern_templates(self, niche):
         """Extract pattern templates from successful videos"""
         if niche not in self.competitor_data or not self.competitor_data[niche]:
@@ -461,11 +694,26 @@ class CompetitorAnalyzer:
         """Extract reusable title patterns"""
         titles = [v["title"] for v in self.competitor_data[niche]]
         
+        # Sort titles into the pattern groups in one pass, lowercasing each title once
+        how_to_titles = []
+        listicle_titles = []
+        question_titles = []
+        personal_titles = []
+        for t in titles:
+            t_lower = t.lower()
+            if t_lower.startswith("how to"):
+                how_to_titles.append(t)
+            if _is_listicle(t):
+                listicle_titles.append(t)
+            if t.endswith("?"):
+                question_titles.append(t)
+            if t_lower.startswith("i ") or "i tried" in t_lower:
+                personal_titles.append(t)
+        
         # Find common patterns
         patterns = []
         
         # How To pattern
-        how_to_titles = [t for t in titles if t.lower().startswith("how to")]
         if how_to_titles:
             patterns.append({
                 "template": "How to {action} to {achieve_result}",
@@ -474,7 +722,6 @@ class CompetitorAnalyzer:
             })
             
         # Listicle pattern
-        listicle_titles = [t for t in titles if re.match(r'^\d+\s', t)]
         if listicle_titles:
             patterns.append({
                 "template": "{number} {things} to {goal}",
@@ -483,7 +730,6 @@ class CompetitorAnalyzer:
             })
             
         # Question pattern
-        question_titles = [t for t in titles if t.endswith("?")]
         if question_titles:
             patterns.append({
                 "template": "{question}?",
@@ -492,7 +738,6 @@ class CompetitorAnalyzer:
             })
             
         # Personal experience pattern
-        personal_titles = [t for t in titles if t.lower().startswith("i ") or "i tried" in t.lower()]
         if personal_titles:
             patterns.append({
                 "template": "I {action} {subject} for {timeframe} | Here's What Happened",
@@ -525,11 +770,13 @@ class CompetitorAnalyzer:
         for intro in intros:
             if "?" in intro[:50]:
                 question_intros += 1
-            if intro.lower().startswith("hey") or intro.lower().startswith("hi") or intro.lower().startswith("hello"):
+            intro_lower = intro.lower()
+            opening = intro_lower[:50]
+            if intro_lower.startswith(("hey", "hi", "hello")):
                 greeting_intros += 1
-            if "today" in intro.lower()[:50] or "going to" in intro.lower()[:50]:
+            if "today" in opening or "going to" in opening:
                 statement_intros += 1
-            if "once" in intro.lower()[:50] or "when i" in intro.lower()[:50]:
+            if "once" in opening or "when i" in opening:
                 story_intros += 1
                 
         total_intros = len(intros)
@@ -567,33 +814,24 @@ class CompetitorAnalyzer:
     
     def _extract_thumbnail_patterns(self, niche):
         """Extract thumbnail patterns"""
-        videos_with_thumbnail = [v for v in self.competitor_data[niche] if "thumbnail" in v]
-        if not videos_with_thumbnail:
+        columns = self._niche_columns(niche)
+        has_thumbnail = columns["has_thumbnail"]
+        total_thumbnails = int(np.count_nonzero(has_thumbnail))
+        if not total_thumbnails:
             return []
             
-        # Analyze composition patterns
-        composition_counts = Counter()
+        # Analyze composition patterns: combine the face/text flags into one code per thumbnail
+        codes = (columns["has_face"][has_thumbnail] * 2 + columns["has_text"][has_thumbnail]).astype(np.intp)
+        counts = np.bincount(codes, minlength=4)
+        
+        # Most common first; ties keep the order in which the compositions first appear
+        present, first_seen = np.unique(codes, return_index=True)
+        order = sorted(zip(present.tolist(), first_seen.tolist()), key=lambda item: (-counts[item[0]], item[1]))
+        composition_counts = [(_THUMBNAIL_COMPOSITIONS[code], int(counts[code])) for code, _ in order]
         
-        for video in videos_with_thumbnail:
-            thumbnail = video["thumbnail"]
-            
-            # Track combination of elements
-            has_face = thumbnail.get("has_face", False)
-            has_text = thumbnail.get("has_text", False)
-            
-            if has_face and has_text:
-                composition_counts["face_and_text"] += 1
-            elif has_face:
-                composition_counts["face_only"] += 1
-            elif has_text:
-                composition_counts["text_only"] += 1
-            else:
-                composition_counts["object_only"] += 1
-                
-        total_thumbnails = len(videos_with_thumbnail)
         thumbnail_patterns = []
         
-        for comp, count in composition_counts.most_common():
+        for comp, count in composition_counts:
             if count > total_thumbnails * 0.1:  # If more than 10% use this pattern
                 thumbnail_patterns.append({
                     "type": comp,
@@ -613,6 +851,7 @@ class CompetitorAnalyzer:
         }
         return descriptions.get(pattern_type, pattern_type)
     
+    @_cached_per_niche
     def generate_competition_report(self, niche):
         """Generate a comprehensive competitive analysis report"""
         if niche not in self.competitor_data or not self.competitor_data[niche]:
@@ -631,14 +870,15 @@ class CompetitorAnalyzer:
         patterns = self.get_pattern_templates(niche)
         
         # Basic channel statistics
-        channels = {}
-        for video in self.competitor_data[niche]:
-            channel = video.get("channel", "Unknown")
-            channels[channel] = channels.get(channel, 0) + 1
-            
-        top_channels = sorted(channels.items(), key=lambda x: x[1], reverse=True)[:5]
+        channels = Counter(video.get("channel", "Unknown") for video in self.competitor_data[niche])
+        top_channels = channels.most_common(5)
         
-        # Build the report
+        # Retention errors (no retention data) carry no recommendations and stay out of the report
+        retention_recommendations = None
+        if isinstance(retention_analysis, dict):
+            retention_recommendations = retention_analysis.get("recommendations")
+        
+        # Build the report, compiling all recommendations into one list
         report = {
             "niche": niche,
             "total_videos_analyzed": len(self.competitor_data[niche]),
@@ -646,21 +886,17 @@ class CompetitorAnalyzer:
             "title_analysis": title_analysis,
             "thumbnail_analysis": thumbnail_analysis,
             "key_patterns": patterns,
-            "recommendations": []
+            "recommendations": [
+                *title_analysis.get("recommendations", ()),
+                *thumbnail_analysis.get("thumbnail_recommendations", ()),
+                *(retention_recommendations or ())
+            ]
         }
         
         # Add retention analysis if available
-        if isinstance(retention_analysis, dict) and "recommendations" in retention_analysis:
+        if retention_recommendations is not None:
             report["retention_analysis"] = retention_analysis
             
-        # Compile all recommendations
-        if "recommendations" in title_analysis:
-            report["recommendations"].extend(title_analysis["recommendations"])
-        if "thumbnail_recommendations" in thumbnail_analysis:
-            report["recommendations"].extend(thumbnail_analysis["thumbnail_recommendations"])
-        if isinstance(retention_analysis, dict) and "recommendations" in retention_analysis:
-            report["recommendations"].extend(retention_analysis["recommendations"])
-            
         return report
     
     def csv_template(self):
@@ -688,13 +924,12 @@ class CompetitorAnalyzer:
             "thumbnail_has_text": "true"
         }
         
-        # Create CSV with headers and example
-        csv_content = ",".join(fields) + "\n"
-        csv_content += ",".join(str(example_row.get(field, "")) for field in fields)
-        
-        # Save template
-        with open("competitor_template.csv", "w", encoding="utf-8") as f:
-            f.write(csv_content)
+        # Save template with headers and example; the writer quotes fields such as
+        # the comma-separated thumbnail colors
+        with open("competitor_template.csv", "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerow(example_row)
             
         return {
             "status": "success", 
@@ -1,6 +1,44 @@
 import os
+import sys
 import json
-from competitor_analysis import CompetitorAnalyzer
+from cli_helpers import NICHE_MAP, ask, is_yes, print_lines, to_float, to_int
+from competitor_analysis import CompetitorAnalyzer, is_error, parse_thumbnail_colors
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Directory the analysis results are saved to
+OUTPUT_DIR = "output"
+
+# Line formats for the printed result rows
+_USAGE_LINE = "- {}: {:.1f}%".format
+_WORD_LINE = "- {word}: {count} occurrences".format_map
+_COLOR_LINE = "- {color}: {count} occurrences".format_map
+_CHANNEL_LINE = "- {channel}: {videos} videos".format_map
+_REC_LINE = "- {recommendation}".format_map
+_REC_LINES = "- {recommendation}\n  {explanation}".format_map
+_PATTERN_LINES = "- Type: {type}\n  Description: {description}\n  Frequency: {frequency}".format_map
+
+_ACTION_MENU = (
+    "\nSelect an action:\n"
+    "1. Add competitor videos manually\n"
+    "2. Create a CSV template for bulk import\n"
+    "3. Import videos from CSV\n"
+    "4. Analyze title patterns\n"
+    "5. Analyze thumbnail patterns\n"
+    "6. Generate pattern templates\n"
+    "7. Generate competition report\n"
+    "8. Exit\n"
+)
+
+_NICHE_MENU = (
+    "\nSelect content niche:\n"
+    "1. Productivity\n"
+    "2. Health & Fitness\n"
+    "3. AI & Technology\n"
+)
 
 def main():
     print("=== YouTube Competitor Pattern Analysis ===")
@@ -8,34 +46,16 @@ def main():
     
     # Initialize the analyzer
     analyzer = CompetitorAnalyzer()
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
     
     while True:
-        print("\nSelect an action:")
-        print("1. Add competitor videos manually")
-        print("2. Create a CSV template for bulk import")
-        print("3. Import videos from CSV")
-        print("4. Analyze title patterns")
-        print("5. Analyze thumbnail patterns")
-        print("6. Generate pattern templates")
-        print("7. Generate competition report")
-        print("8. Exit")
+        sys.stdout.write(_ACTION_MENU)
         
-        choice = input("\nEnter your choice (1-8): ")
+        choice = ask("\nEnter your choice (1-8): ")
         
-        if choice == "1":
-            add_video_manually(analyzer)
-        elif choice == "2":
-            create_csv_template(analyzer)
-        elif choice == "3":
-            import_from_csv(analyzer)
-        elif choice == "4":
-            analyze_title_patterns(analyzer)
-        elif choice == "5":
-            analyze_thumbnail_patterns(analyzer)
-        elif choice == "6":
-            generate_patterns(analyzer)
-        elif choice == "7":
-            generate_report(analyzer)
+        handler = ACTIONS.get(choice)
+        if handler:
+            handler(analyzer)
         elif choice == "8":
             print("Exiting. Thank you for using the Competitor Pattern Analysis tool!")
             break
@@ -50,45 +70,41 @@ def add_video_manually(analyzer):
     niche = get_niche()
     
     # Get video details
-    title = input("Enter video title: ")
-    url = input("Enter video URL: ")
-    channel = input("Enter channel name: ")
-    views = input("Enter view count (numbers only): ")
+    title = ask("Enter video title: ")
+    url = ask("Enter video URL: ")
+    channel = ask("Enter channel name: ")
+    views = ask("Enter view count (numbers only): ")
     
     # Optional metrics
-    ctr = input("Enter CTR if known (e.g., 5.2): ")
-    retention = input("Enter average retention percentage if known (e.g., 45.7): ")
+    ctr = ask("Enter CTR if known (e.g., 5.2): ")
+    retention = ask("Enter average retention percentage if known (e.g., 45.7): ")
     
     # Thumbnail info
-    has_face = input("Does thumbnail have a face? (y/n): ").lower() == 'y'
-    has_text = input("Does thumbnail have text? (y/n): ").lower() == 'y'
-    colors = input("Enter main colors separated by commas (e.g., red,black,white): ")
+    has_face = is_yes(ask("Does thumbnail have a face? (y/n): "))
+    has_text = is_yes(ask("Does thumbnail have text? (y/n): "))
+    colors = ask("Enter main colors separated by commas (e.g., red,black,white): ")
     
     # Create video info object
     video_info = {
         "title": title,
         "url": url,
         "channel": channel,
-        "views": int(views) if views.isdigit() else 0,
+        "views": max(to_int(views, 0), 0),
         "thumbnail": {
             "has_face": has_face,
             "has_text": has_text,
-            "colors": colors.split(",") if colors else []
+            "colors": parse_thumbnail_colors(colors)
         }
     }
     
     # Add optional metrics if provided
-    if ctr:
-        try:
-            video_info["ctr"] = float(ctr)
-        except ValueError:
-            pass
-            
-    if retention:
-        try:
-            video_info["retention"] = float(retention)
-        except ValueError:
-            pass
+    ctr = to_float(ctr)
+    if ctr is not None:
+        video_info["ctr"] = ctr
+        
+    retention = to_float(retention)
+    if retention is not None:
+        video_info["retention"] = retention
     
     # Add to database
     result = analyzer.manual_add_video(video_info, niche)
@@ -110,14 +126,14 @@ def import_from_csv(analyzer):
     niche = get_niche()
     
     # Get file path
-    file_path = input("Enter the path to your CSV file: ")
+    file_path = ask("Enter the path to your CSV file: ")
     
-    if not os.path.exists(file_path):
-        print(f"Error: File not found at {file_path}")
+    # Import the data; opening the file is the existence check
+    result = analyzer.bulk_add_from_csv(file_path, niche)
+    if is_error(result):
+        print(f"Error: {result['message']}")
         return
         
-    # Import the data
-    result = analyzer.bulk_add_from_csv(file_path, niche)
     print(f"\nResult: {result['message']}")
 
 def analyze_title_patterns(analyzer):
@@ -130,32 +146,28 @@ def analyze_title_patterns(analyzer):
     # Analyze
     result = analyzer.analyze_title_patterns(niche)
     
-    if "status" in result and result["status"] == "error":
+    if is_error(result):
         print(f"Error: {result['message']}")
         return
         
     # Print results
-    print(f"\nAnalyzed {result['total_videos_analyzed']} videos in the {niche} niche")
-    print(f"Average title word count: {result['average_word_count']:.1f} words")
+    lines = [
+        f"\nAnalyzed {result['total_videos_analyzed']} videos in the {niche} niche",
+        f"Average title word count: {result['average_word_count']:.1f} words",
+        "\nPattern Usage:"
+    ]
+    lines.extend(_USAGE_LINE(pattern, percentage) for pattern, percentage in result["pattern_usage"].items())
     
-    print("\nPattern Usage:")
-    for pattern, percentage in result["pattern_usage"].items():
-        print(f"- {pattern}: {percentage:.1f}%")
-        
-    print("\nMost Common Words:")
-    for word_info in result["common_words"][:10]:
-        print(f"- {word_info['word']}: {word_info['count']} occurrences")
-        
-    print("\nRecommendations:")
-    for rec in result["pattern_recommendations"]:
-        print(f"- {rec['recommendation']}")
-        print(f"  {rec['explanation']}")
+    lines.append("\nMost Common Words:")
+    lines.extend(map(_WORD_LINE, result["common_words"][:10]))
+    
+    lines.append("\nRecommendations:")
+    lines.extend(map(_REC_LINES, result["pattern_recommendations"]))
+    print_lines(lines)
         
     # Save to file
-    output_file = f"output/{niche}_title_analysis.json"
-    os.makedirs("output", exist_ok=True)
-    with open(output_file, "w") as f:
-        json.dump(result, f, indent=4)
+    output_file = f"{OUTPUT_DIR}/{niche}_title_analysis.json"
+    save_result(output_file, result)
         
     print(f"\nDetailed results saved to {output_file}")
 
@@ -169,30 +181,26 @@ def analyze_thumbnail_patterns(analyzer):
     # Analyze
     result = analyzer.analyze_thumbnail_patterns(niche)
     
-    if "status" in result and result["status"] == "error":
+    if is_error(result):
         print(f"Error: {result['message']}")
         return
         
     # Print results
-    print(f"\nAnalyzed {result['total_thumbnails_analyzed']} thumbnails in the {niche} niche")
+    lines = [
+        f"\nAnalyzed {result['total_thumbnails_analyzed']} thumbnails in the {niche} niche",
+        f"\nFace Presence: {result['face_presence']['percentage']:.1f}% of thumbnails",
+        f"Text Presence: {result['text_presence']['percentage']:.1f}% of thumbnails",
+        "\nCommon Colors:"
+    ]
+    lines.extend(map(_COLOR_LINE, result["common_colors"]))
     
-    print(f"\nFace Presence: {result['face_presence']['percentage']:.1f}% of thumbnails")
-    print(f"Text Presence: {result['text_presence']['percentage']:.1f}% of thumbnails")
-    
-    print("\nCommon Colors:")
-    for color_info in result["common_colors"]:
-        print(f"- {color_info['color']}: {color_info['count']} occurrences")
-        
-    print("\nRecommendations:")
-    for rec in result["thumbnail_recommendations"]:
-        print(f"- {rec['recommendation']}")
-        print(f"  {rec['explanation']}")
+    lines.append("\nRecommendations:")
+    lines.extend(map(_REC_LINES, result["thumbnail_recommendations"]))
+    print_lines(lines)
         
     # Save to file
-    output_file = f"output/{niche}_thumbnail_analysis.json"
-    os.makedirs("output", exist_ok=True)
-    with open(output_file, "w") as f:
-        json.dump(result, f, indent=4)
+    output_file = f"{OUTPUT_DIR}/{niche}_thumbnail_analysis.json"
+    save_result(output_file, result)
         
     print(f"\nDetailed results saved to {output_file}")
 
@@ -206,36 +214,27 @@ def generate_patterns(analyzer):
     # Generate patterns
     result = analyzer.get_pattern_templates(niche)
     
-    if "status" in result and result["status"] == "error":
+    if is_error(result):
         print(f"Error: {result['message']}")
         return
         
     # Print results
-    print(f"\nPattern Templates for {niche} niche:")
-    
-    print("\nTitle Patterns:")
+    lines = [f"\nPattern Templates for {niche} niche:", "\nTitle Patterns:"]
     for pattern in result["title_patterns"]:
-        print(f"- Template: {pattern['template']}")
-        print(f"  Frequency: {pattern['frequency']}")
-        print(f"  Examples: {', '.join(pattern['examples'][:2])}")
+        lines.append(f"- Template: {pattern['template']}")
+        lines.append(f"  Frequency: {pattern['frequency']}")
+        lines.append(f"  Examples: {', '.join(pattern['examples'][:2])}")
         
-    print("\nScript Patterns:")
-    for pattern in result["script_patterns"]:
-        print(f"- Type: {pattern['type']}")
-        print(f"  Description: {pattern['description']}")
-        print(f"  Frequency: {pattern['frequency']}")
-        
-    print("\nThumbnail Patterns:")
-    for pattern in result["thumbnail_patterns"]:
-        print(f"- Type: {pattern['type']}")
-        print(f"  Description: {pattern['description']}")
-        print(f"  Frequency: {pattern['frequency']}")
+    lines.append("\nScript Patterns:")
+    lines.extend(map(_PATTERN_LINES, result["script_patterns"]))
+    
+    lines.append("\nThumbnail Patterns:")
+    lines.extend(map(_PATTERN_LINES, result["thumbnail_patterns"]))
+    print_lines(lines)
         
     # Save to file
-    output_file = f"output/{niche}_patterns.json"
-    os.makedirs("output", exist_ok=True)
-    with open(output_file, "w") as f:
-        json.dump(result, f, indent=4)
+    output_file = f"{OUTPUT_DIR}/{niche}_patterns.json"
+    save_result(output_file, result)
         
     print(f"\nDetailed patterns saved to {output_file}")
 
@@ -249,48 +248,55 @@ def generate_report(analyzer):
     # Generate report
     result = analyzer.generate_competition_report(niche)
     
-    if "status" in result and result["status"] == "error":
+    if is_error(result):
         print(f"Error: {result['message']}")
         return
         
     # Print summary
-    print(f"\nCompetition Analysis for {niche} niche")
-    print(f"Analyzed {result['total_videos_analyzed']} videos")
+    lines = [
+        f"\nCompetition Analysis for {niche} niche",
+        f"Analyzed {result['total_videos_analyzed']} videos",
+        "\nTop Channels:"
+    ]
+    lines.extend(map(_CHANNEL_LINE, result["top_channels"]))
     
-    print("\nTop Channels:")
-    for channel in result["top_channels"]:
-        print(f"- {channel['channel']}: {channel['videos']} videos")
-        
-    print("\nKey Recommendations:")
-    for rec in result["recommendations"]:
-        print(f"- {rec['recommendation']}")
+    lines.append("\nKey Recommendations:")
+    lines.extend(map(_REC_LINE, result["recommendations"]))
+    print_lines(lines)
         
     # Save detailed report
-    output_file = f"output/{niche}_competition_report.json"
-    os.makedirs("output", exist_ok=True)
-    with open(output_file, "w") as f:
-        json.dump(result, f, indent=4)
+    output_file = f"{OUTPUT_DIR}/{niche}_competition_report.json"
+    save_result(output_file, result)
         
     print(f"\nDetailed competition report saved to {output_file}")
 
+def save_result(output_file, result):
+    """Save an analysis result as indented JSON"""
+    if orjson is not None:
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, "w") as f:
+            json.dump(result, f, indent=2)
+
 def get_niche():
     """Get niche from user"""
-    print("\nSelect content niche:")
-    print("1. Productivity")
-    print("2. Health & Fitness")
-    print("3. AI & Technology")
-    
-    niche_map = {
-        "1": "productivity",
-        "2": "health_fitness", 
-        "3": "ai_tech"
-    }
+    sys.stdout.write(_NICHE_MENU)
     
-    while True:
-        choice = input("Enter your choice (1-3): ")
-        if choice in niche_map:
-            return niche_map[choice]
+    while (niche := NICHE_MAP.get(ask("Enter your choice (1-3): "))) is None:
         print("Invalid choice. Please try again.")
+    return niche
+
+# Menu choice -> handler for every action except exit
+ACTIONS = {
+    "1": add_video_manually,
+    "2": create_csv_template,
+    "3": import_from_csv,
+    "4": analyze_title_patterns,
+    "5": analyze_thumbnail_patterns,
+    "6": generate_patterns,
+    "7": generate_report
+}
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
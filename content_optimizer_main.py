@@ -1,12 +1,132 @@
 import os
+import sys
 import json
-from youtube_optimizer import YouTubeOptimizer
-from competitor_analysis import CompetitorAnalyzer
+import time
+import heapq
+from functools import cached_property
+from itertools import starmap
+from operator import itemgetter
+from pathlib import Path
+from cli_helpers import NICHE_MAP, ask, is_yes, print_lines, read_line, to_float
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# analyze_patterns choices that include the title and the thumbnail analysis
+_TITLE_CHOICES = frozenset({"1", "3"})
+_THUMB_CHOICES = frozenset({"2", "3"})
+
+# Line format for one pattern usage percentage
+_USAGE_LINE = "- {}: {:.1f}%".format
+
+# Column order of a pasted tab-separated video row (also the order the fields are prompted in)
+VIDEO_ROW_FIELDS = ("title", "url", "channel", "views", "ctr", "retention", "has_face", "has_text", "colors")
+
+# Optional video metrics entered as decimal numbers, in prompt order
+OPTIONAL_FLOAT_FIELDS = ("ctr", "retention")
+
+# Script outline per niche: (section, content) with {topic} filled in from the video topic
+SCRIPT_STRUCTURES = {
+    "productivity": (
+        ("Hook", "Start with a surprising fact or result related to productivity"),
+        ("Problem", "Describe the common challenges with {topic}"),
+        ("Solution Overview", "Briefly outline your approach/method"),
+        ("Your Story", "Share your personal experience with this approach"),
+        ("Step-by-Step Implementation", "Detailed walkthrough of the method"),
+        ("Results", "Show the outcomes and benefits achieved"),
+        ("Viewer Application", "How viewers can apply this to their own lives"),
+        ("CTA", "Ask for subscription and comments on viewers' experiences")
+    ),
+    "health_fitness": (
+        ("Hook", "Show a transformation or end result to build curiosity"),
+        ("Problem", "Discuss common struggles with {topic}"),
+        ("Your Experience", "Share your personal journey/credentials"),
+        ("Method Introduction", "Introduce your approach/technique"),
+        ("Scientific Basis", "Brief explanation of why this works"),
+        ("Step-by-Step Guide", "Detailed instructions for viewers"),
+        ("Common Mistakes", "Pitfalls to avoid for best results"),
+        ("Expected Timeline", "When viewers can expect to see results"),
+        ("CTA", "Invite viewers to share their progress in comments")
+    ),
+    "ai_tech": (
+        ("Hook", "Demonstrate an impressive capability related to the topic"),
+        ("Problem Context", "Explain why {topic} is important/relevant"),
+        ("Technical Overview", "Explain the core technology/concept"),
+        ("Practical Demonstration", "Show the technology in action"),
+        ("Step-by-Step Guide", "How viewers can implement this themselves"),
+        ("Use Cases", "Different applications or scenarios"),
+        ("Limitations", "Honest assessment of current limitations"),
+        ("Future Potential", "Where this technology is heading"),
+        ("CTA", "Encourage viewers to try it and share results")
+    )
+}
+
+# Title suggestions for the competitors' most used title patterns
+PATTERN_TITLE_TEMPLATES = {
+    "how_to": (
+        "How to {topic} Like a Pro",
+        "How I Mastered {topic} in Just 30 Days"
+    ),
+    "listicle": (
+        "5 Game-Changing {topic} Techniques No One Talks About",
+        "7 Ways to Transform Your {topic} Results Overnight"
+    ),
+    "question": (
+        "Is {topic} Actually Worth Your Time? The Truth Revealed",
+        "Why Most People Fail at {topic} (And How Not To)"
+    ),
+    "i_personal": (
+        "I Tried {topic} for 30 Days | Here's What Happened",
+        "I Discovered This {topic} Secret and It Changed Everything"
+    )
+}
+
+class _SafeDict(dict):
+    """Substitutions for str.format_map that leave unknown {placeholders} in place"""
+    def __missing__(self, key):
+        return "{" + key + "}"
+
+def save_json(path, obj):
+    """Write obj to path (a Path) as indented JSON, encoded by orjson when it is installed"""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        data = json.dumps(obj, indent=2).encode("utf-8")
+    path.write_bytes(data)
 
 class ContentOptimizer:
     def __init__(self):
-        self.optimizer = YouTubeOptimizer()
-        self.competitor_analyzer = CompetitorAnalyzer()
+        self._outdir = Path("output")
+        self._outdir.mkdir(exist_ok=True)
+        
+        # Menu choice -> action, for every choice except leaving the menu
+        self._main_actions = {
+            "1": self.competitor_analysis_menu,
+            "2": self.script_optimization,
+            "3": self.title_description_generator,
+            "4": self.thumbnail_recommendation,
+            "5": self.smart_content_planner
+        }
+        self._competitor_actions = {
+            "1": self.add_competitor_videos,
+            "2": self.import_videos_from_csv,
+            "3": self.analyze_patterns,
+            "4": self.generate_competition_report
+        }
+        
+    # The optimizer and the analyzer (and the modules behind them) are only loaded
+    # by the first menu action that needs them
+    @cached_property
+    def optimizer(self):
+        from youtube_optimizer import YouTubeOptimizer
+        return YouTubeOptimizer()
+        
+    @cached_property
+    def competitor_analyzer(self):
+        from competitor_analysis import CompetitorAnalyzer
+        return CompetitorAnalyzer()
         
     def main_menu(self):
         """Display main menu and handle user choices"""
@@ -22,18 +142,11 @@ class ContentOptimizer:
             print("5. Smart Content Planner")
             print("6. Exit")
             
-            choice = input("\nEnter your choice (1-6): ")
+            choice = ask("\nEnter your choice (1-6): ")
             
-            if choice == "1":
-                self.competitor_analysis_menu()
-            elif choice == "2":
-                self.script_optimization()
-            elif choice == "3":
-                self.title_description_generator()
-            elif choice == "4":
-                self.thumbnail_recommendation()
-            elif choice == "5":
-                self.smart_content_planner()
+            action = self._main_actions.get(choice)
+            if action:
+                action()
             elif choice == "6":
                 print("Thank you for using the YouTube Content Optimizer!")
                 break
@@ -52,16 +165,11 @@ class ContentOptimizer:
             print("4. Generate competition report")
             print("5. Return to main menu")
             
-            choice = input("\nEnter your choice (1-5): ")
+            choice = ask("\nEnter your choice (1-5): ")
             
-            if choice == "1":
-                self.add_competitor_videos()
-            elif choice == "2":
-                self.import_videos_from_csv()
-            elif choice == "3":
-                self.analyze_patterns()
-            elif choice == "4":
-                self.generate_competition_report()
+            action = self._competitor_actions.get(choice)
+            if action:
+                action()
             elif choice == "5":
                 return
             else:
@@ -76,58 +184,83 @@ class ContentOptimizer:
         
         # How many videos to add
         try:
-            num_videos = int(input("How many videos do you want to add? "))
+            num_videos = int(ask("How many videos do you want to add? "))
         except ValueError:
             print("Invalid number. Adding one video.")
             num_videos = 1
             
-        for i in range(num_videos):
-            print(f"\nVideo {i+1}:")
-            
-            # Get basic video details
-            title = input("Title: ")
-            url = input("URL: ")
-            channel = input("Channel name: ")
-            views = input("Views (numbers only): ")
-            
-            # Optional metrics
-            ctr = input("CTR if known (e.g., 5.2) or press Enter to skip: ")
-            retention = input("Retention % if known (e.g., 45.7) or press Enter to skip: ")
-            
-            # Thumbnail info
-            has_face = input("Does thumbnail have a face? (y/n): ").lower() == 'y'
-            has_text = input("Does thumbnail have text? (y/n): ").lower() == 'y'
-            colors = input("Main colors (e.g., red,black,white): ")
-            
-            # Create video info object
-            video_info = {
-                "title": title,
-                "url": url,
-                "channel": channel,
-                "views": int(views) if views.isdigit() else 0,
-                "thumbnail": {
-                    "has_face": has_face,
-                    "has_text": has_text,
-                    "colors": colors.split(",") if colors else []
-                }
-            }
-            
-            # Add optional metrics if provided
-            if ctr:
-                try:
-                    video_info["ctr"] = float(ctr)
-                except ValueError:
-                    pass
+        # Rows copied from a spreadsheet arrive as one tab-separated line per video
+        paste_rows = is_yes(ask("Paste tab-separated rows instead of answering each prompt? (y/n): "))
+        if paste_rows:
+            print("Columns: " + "\t".join(VIDEO_ROW_FIELDS))
+            
+        # The database is written once after the last video rather than after each one
+        with self.competitor_analyzer.deferred_save():
+            for i in range(num_videos):
+                if paste_rows:
+                    line = read_line()
+                    if line is None:
+                        break
+                    fields = self._split_video_row(line)
+                else:
+                    fields = self._ask_video_fields(i)
                     
-            if retention:
-                try:
-                    video_info["retention"] = float(retention)
-                except ValueError:
-                    pass
-            
-            # Add to database
-            result = self.competitor_analyzer.manual_add_video(video_info, niche)
-            print(f"Result: {result['message']}")
+                video_info = self._video_info(*fields)
+                
+                # Add to database
+                result = self.competitor_analyzer.manual_add_video(video_info, niche)
+                print(f"Result: {result['message']}")
+    
+    def _split_video_row(self, line):
+        """Split a pasted tab-separated row into the VIDEO_ROW_FIELDS values, ignoring extra columns and padding missing trailing ones"""
+        fields = line.split("\t")[:len(VIDEO_ROW_FIELDS)]
+        fields += [""] * (len(VIDEO_ROW_FIELDS) - len(fields))
+        return fields
+    
+    def _ask_video_fields(self, i):
+        """Prompt for each field of video number i+1, in VIDEO_ROW_FIELDS order"""
+        print(f"\nVideo {i+1}:")
+        
+        # Get basic video details
+        title = ask("Title: ")
+        url = ask("URL: ")
+        channel = ask("Channel name: ")
+        views = ask("Views (numbers only): ")
+        
+        # Optional metrics
+        ctr = ask("CTR if known (e.g., 5.2) or press Enter to skip: ")
+        retention = ask("Retention % if known (e.g., 45.7) or press Enter to skip: ")
+        
+        # Thumbnail info
+        has_face = ask("Does thumbnail have a face? (y/n): ")
+        has_text = ask("Does thumbnail have text? (y/n): ")
+        colors = ask("Main colors (e.g., red,black,white): ")
+        
+        return title, url, channel, views, ctr, retention, has_face, has_text, colors
+    
+    def _video_info(self, title, url, channel, views, ctr, retention, has_face, has_text, colors):
+        """Build a competitor video record from the text entered for each field"""
+        from competitor_analysis import parse_thumbnail_colors
+        
+        video_info = {
+            "title": title,
+            "url": url,
+            "channel": channel,
+            "views": int(views) if views.isdigit() else 0,
+            "thumbnail": {
+                "has_face": is_yes(has_face),
+                "has_text": is_yes(has_text),
+                "colors": parse_thumbnail_colors(colors)
+            }
+        }
+        
+        # Add optional metrics if provided
+        for field, text in zip(OPTIONAL_FLOAT_FIELDS, (ctr, retention)):
+            value = to_float(text)
+            if value is not None:
+                video_info[field] = value
+                
+        return video_info
     
     def import_videos_from_csv(self):
         """Import videos from CSV file"""
@@ -138,7 +271,7 @@ class ContentOptimizer:
         print("1. Yes, create a template")
         print("2. No, I already have a CSV file")
         
-        choice = input("\nEnter choice (1-2): ")
+        choice = ask("\nEnter choice (1-2): ")
         
         if choice == "1":
             result = self.competitor_analyzer.csv_template()
@@ -149,7 +282,7 @@ class ContentOptimizer:
         niche = self.get_niche()
         
         # Get file path
-        file_path = input("Enter the path to your CSV file: ")
+        file_path = ask("Enter the path to your CSV file: ")
         
         if not os.path.exists(file_path):
             print(f"Error: File not found at {file_path}")
@@ -161,6 +294,8 @@ class ContentOptimizer:
     
     def analyze_patterns(self):
         """Analyze patterns from competitor videos"""
+        from competitor_analysis import is_error
+        
         print("\n=== Analyze Patterns ===")
         
         # Get niche
@@ -171,61 +306,63 @@ class ContentOptimizer:
         print("2. Thumbnail patterns")
         print("3. All patterns")
         
-        choice = input("\nEnter choice (1-3): ")
+        choice = ask("\nEnter choice (1-3): ")
         
-        if choice == "1" or choice == "3":
+        if choice in _TITLE_CHOICES:
             # Analyze title patterns
             print("\nAnalyzing title patterns...")
             title_result = self.competitor_analyzer.analyze_title_patterns(niche)
             
-            if "status" in title_result and title_result["status"] == "error":
+            if is_error(title_result):
                 print(f"Error analyzing titles: {title_result['message']}")
             else:
-                print(f"\nTitle Analysis Results ({title_result['total_videos_analyzed']} videos):")
-                
-                print("\nPattern Usage:")
-                for pattern, percentage in title_result["pattern_usage"].items():
-                    print(f"- {pattern}: {percentage:.1f}%")
+                lines = [
+                    f"\nTitle Analysis Results ({title_result['total_videos_analyzed']} videos):",
+                    "\nPattern Usage:"
+                ]
+                lines.extend(starmap(_USAGE_LINE, title_result["pattern_usage"].items()))
                     
-                print("\nTitle Recommendations:")
+                lines.append("\nTitle Recommendations:")
                 for rec in title_result["pattern_recommendations"]:
-                    print(f"- {rec['recommendation']}")
-                    print(f"  {rec['explanation']}")
+                    lines.append(f"- {rec['recommendation']}")
+                    lines.append(f"  {rec['explanation']}")
+                print_lines(lines)
                 
                 # Save results
-                os.makedirs("output", exist_ok=True)
-                with open(f"output/{niche}_title_analysis.json", "w") as f:
-                    json.dump(title_result, f, indent=4)
+                output_file = self._outdir / f"{niche}_title_analysis.json"
+                save_json(output_file, title_result)
                     
-                print(f"Detailed title analysis saved to output/{niche}_title_analysis.json")
+                print(f"Detailed title analysis saved to {output_file}")
         
-        if choice == "2" or choice == "3":
+        if choice in _THUMB_CHOICES:
             # Analyze thumbnail patterns
             print("\nAnalyzing thumbnail patterns...")
             thumbnail_result = self.competitor_analyzer.analyze_thumbnail_patterns(niche)
             
-            if "status" in thumbnail_result and thumbnail_result["status"] == "error":
+            if is_error(thumbnail_result):
                 print(f"Error analyzing thumbnails: {thumbnail_result['message']}")
             else:
-                print(f"\nThumbnail Analysis Results ({thumbnail_result['total_thumbnails_analyzed']} thumbnails):")
-                
-                print(f"Face Presence: {thumbnail_result['face_presence']['percentage']:.1f}% of thumbnails")
-                print(f"Text Presence: {thumbnail_result['text_presence']['percentage']:.1f}% of thumbnails")
-                
-                print("\nThumbnail Recommendations:")
+                lines = [
+                    f"\nThumbnail Analysis Results ({thumbnail_result['total_thumbnails_analyzed']} thumbnails):",
+                    f"Face Presence: {thumbnail_result['face_presence']['percentage']:.1f}% of thumbnails",
+                    f"Text Presence: {thumbnail_result['text_presence']['percentage']:.1f}% of thumbnails",
+                    "\nThumbnail Recommendations:"
+                ]
                 for rec in thumbnail_result["thumbnail_recommendations"]:
-                    print(f"- {rec['recommendation']}")
-                    print(f"  {rec['explanation']}")
+                    lines.append(f"- {rec['recommendation']}")
+                    lines.append(f"  {rec['explanation']}")
+                print_lines(lines)
                 
                 # Save results
-                os.makedirs("output", exist_ok=True)
-                with open(f"output/{niche}_thumbnail_analysis.json", "w") as f:
-                    json.dump(thumbnail_result, f, indent=4)
+                output_file = self._outdir / f"{niche}_thumbnail_analysis.json"
+                save_json(output_file, thumbnail_result)
                     
-                print(f"Detailed thumbnail analysis saved to output/{niche}_thumbnail_analysis.json")
+                print(f"Detailed thumbnail analysis saved to {output_file}")
     
     def generate_competition_report(self):
         """Generate comprehensive competition report"""
+        from competitor_analysis import is_error
+        
         print("\n=== Generate Competition Report ===")
         
         # Get niche
@@ -234,47 +371,41 @@ class ContentOptimizer:
         print(f"\nGenerating competition report for {niche} niche...")
         report = self.competitor_analyzer.generate_competition_report(niche)
         
-        if "status" in report and report["status"] == "error":
+        if is_error(report):
             print(f"Error: {report['message']}")
             return
             
         # Print summary
-        print(f"\nCompetition Analysis for {niche} niche")
-        print(f"Analyzed {report['total_videos_analyzed']} videos")
-        
-        print("\nTop Channels:")
+        lines = [
+            f"\nCompetition Analysis for {niche} niche",
+            f"Analyzed {report['total_videos_analyzed']} videos",
+            "\nTop Channels:"
+        ]
         for channel in report["top_channels"]:
-            print(f"- {channel['channel']}: {channel['videos']} videos")
+            lines.append(f"- {channel['channel']}: {channel['videos']} videos")
             
-        print("\nKey Recommendations:")
+        lines.append("\nKey Recommendations:")
         for rec in report["recommendations"]:
-            print(f"- {rec['recommendation']}")
+            lines.append(f"- {rec['recommendation']}")
+        print_lines(lines)
             
         # Save detailed report
-        output_file = f"output/{niche}_competition_report.json"
-        os.makedirs("output", exist_ok=True)
-        with open(output_file, "w") as f:
-            json.dump(report, f, indent=4)
+        output_file = self._outdir / f"{niche}_competition_report.json"
+        save_json(output_file, report)
             
         print(f"\nDetailed competition report saved to {output_file}")
     
     def script_optimization(self):
         """Optimize a script based on patterns"""
+        from competitor_analysis import is_error
+        
         print("\n=== Script Optimization ===")
         
         # Get niche
         niche = self.get_niche()
         
         # Get script content
-        print(f"\nEnter your script for the {niche} video (type 'END' on a new line when finished):")
-        script_lines = []
-        while True:
-            line = input()
-            if line == "END":
-                break
-            script_lines.append(line)
-        
-        script_text = "\n".join(script_lines)
+        script_text = self.read_script(f"\nEnter your script for the {niche} video (type 'END' on a new line when finished, or @<file> to load it from a file):")
         
         if not script_text.strip():
             print("Error: Empty script. Please enter a script to analyze.")
@@ -284,7 +415,7 @@ class ContentOptimizer:
         print("\nChecking for competitor patterns...")
         patterns = self.competitor_analyzer.get_pattern_templates(niche)
         
-        has_patterns = not ("status" in patterns and patterns["status"] == "error")
+        has_patterns = not is_error(patterns)
         
         if has_patterns:
             print("Found competitor patterns to compare against.")
@@ -317,10 +448,8 @@ class ContentOptimizer:
             print(f"- {rec['suggestion']}")
         
         # Save the analysis
-        output_file = f"output/script_analysis_{niche}.json"
-        os.makedirs("output", exist_ok=True)
-        with open(output_file, "w") as f:
-            json.dump(analysis, f, indent=4)
+        output_file = self._outdir / f"script_analysis_{niche}.json"
+        save_json(output_file, analysis)
             
         print(f"\nDetailed script analysis saved to {output_file}")
     
@@ -336,19 +465,11 @@ class ContentOptimizer:
         print("1. A full script")
         print("2. Just a topic/concept")
         
-        choice = input("\nEnter choice (1-2): ")
+        choice = ask("\nEnter choice (1-2): ")
         
         if choice == "1":
             # Get script content
-            print(f"\nEnter your script (type 'END' on a new line when finished):")
-            script_lines = []
-            while True:
-                line = input()
-                if line == "END":
-                    break
-                script_lines.append(line)
-            
-            script_text = "\n".join(script_lines)
+            script_text = self.read_script("\nEnter your script (type 'END' on a new line when finished, or @<file> to load it from a file):")
             
             if not script_text.strip():
                 print("Error: Empty script. Please enter a script to analyze.")
@@ -364,7 +485,7 @@ class ContentOptimizer:
                 print(f"{i+1}. {option['title']} (CTR Score: {option['ctr_score']})")
             
             # Select a title
-            title_choice = input("\nSelect a title number or enter a custom title: ")
+            title_choice = ask("\nSelect a title number or enter a custom title: ")
             try:
                 title_index = int(title_choice) - 1
                 selected_title = title_options["title_options"][title_index]["title"]
@@ -386,16 +507,14 @@ class ContentOptimizer:
                 "description": description
             }
             
-            output_file = f"output/title_description_{niche}.json"
-            os.makedirs("output", exist_ok=True)
-            with open(output_file, "w") as f:
-                json.dump(output, f, indent=4)
+            output_file = self._outdir / f"title_description_{niche}.json"
+            save_json(output_file, output)
                 
             print(f"\nSaved title and description to {output_file}")
             
         else:
             # Get topic
-            topic = input("\nEnter your video topic/concept: ")
+            topic = ask("\nEnter your video topic/concept: ")
             
             if not topic.strip():
                 print("Error: Empty topic. Please enter a topic.")
@@ -408,18 +527,21 @@ class ContentOptimizer:
             print("\nGenerating title options...")
             title_options = self.optimizer.generate_title_options(minimal_script, niche=niche)
             
+            # Placeholders filled in from the topic; the other template placeholders are kept
+            subs = _SafeDict(goal=topic, action=f"Master {topic}")
+            
             # Show title options
             print("\nRecommended Title Options:")
             for i, option in enumerate(title_options["title_options"]):
-                title = option["title"].replace("{goal}", topic).replace("{action}", f"Master {topic}")
+                title = option["title"].format_map(subs)
                 print(f"{i+1}. {title} (CTR Score: {option['ctr_score']})")
             
             # Select a title
-            title_choice = input("\nSelect a title number or enter a custom title: ")
+            title_choice = ask("\nSelect a title number or enter a custom title: ")
             try:
                 title_index = int(title_choice) - 1
                 template_title = title_options["title_options"][title_index]["title"]
-                selected_title = template_title.replace("{goal}", topic).replace("{action}", f"Master {topic}")
+                selected_title = template_title.format_map(subs)
             except (ValueError, IndexError):
                 selected_title = title_choice
                 
@@ -439,22 +561,22 @@ class ContentOptimizer:
                 "description_template": description
             }
             
-            output_file = f"output/title_concept_{niche}.json"
-            os.makedirs("output", exist_ok=True)
-            with open(output_file, "w") as f:
-                json.dump(output, f, indent=4)
+            output_file = self._outdir / f"title_concept_{niche}.json"
+            save_json(output_file, output)
                 
             print(f"\nSaved title and description template to {output_file}")
     
     def thumbnail_recommendation(self):
         """Generate thumbnail recommendations"""
+        from competitor_analysis import is_error
+        
         print("\n=== Thumbnail Recommendation ===")
         
         # Get niche
         niche = self.get_niche()
         
         # Get title
-        title = input("\nEnter your video title: ")
+        title = ask("\nEnter your video title: ")
         
         if not title.strip():
             print("Error: Empty title. Please enter a title.")
@@ -462,19 +584,11 @@ class ContentOptimizer:
             
         # Get script if available
         print("\nDo you have a script? A script helps generate better thumbnail recommendations.")
-        has_script = input("Do you have a script? (y/n): ").lower() == 'y'
+        has_script = is_yes(ask("Do you have a script? (y/n): "))
         
         script_text = ""
         if has_script:
-            print("\nEnter your script (type 'END' on a new line when finished):")
-            script_lines = []
-            while True:
-                line = input()
-                if line == "END":
-                    break
-                script_lines.append(line)
-            
-            script_text = "\n".join(script_lines)
+            script_text = self.read_script("\nEnter your script (type 'END' on a new line when finished, or @<file> to load it from a file):")
         else:
             # Create minimal script from title
             script_text = f"This video is about {title}. It covers important aspects of {title} related to {niche}."
@@ -485,57 +599,61 @@ class ContentOptimizer:
         
         # First check competitor data if available
         competitor_thumbnails = self.competitor_analyzer.analyze_thumbnail_patterns(niche)
-        has_competitor_data = not ("status" in competitor_thumbnails and competitor_thumbnails["status"] == "error")
+        has_competitor_data = not is_error(competitor_thumbnails)
         
         # Show recommendations
-        print("\nThumbnail Recommendations:")
+        lines = ["\nThumbnail Recommendations:"]
         
         if has_competitor_data:
-            print("\nCompetitor Insights:")
-            print(f"- {competitor_thumbnails['face_presence']['percentage']:.1f}% of competitors use faces in thumbnails")
-            print(f"- {competitor_thumbnails['text_presence']['percentage']:.1f}% use text overlays")
-            print("- Popular colors: " + ", ".join(info["color"] for info in competitor_thumbnails["common_colors"][:3]))
+            lines.append("\nCompetitor Insights:")
+            lines.append(f"- {competitor_thumbnails['face_presence']['percentage']:.1f}% of competitors use faces in thumbnails")
+            lines.append(f"- {competitor_thumbnails['text_presence']['percentage']:.1f}% use text overlays")
+            lines.append("- Popular colors: " + ", ".join(map(itemgetter("color"), competitor_thumbnails["common_colors"][:3])))
             
             # Specific recommendations
             for rec in competitor_thumbnails["thumbnail_recommendations"]:
-                print(f"- {rec['recommendation']}")
-                print(f"  {rec['explanation']}")
+                lines.append(f"- {rec['recommendation']}")
+                lines.append(f"  {rec['explanation']}")
         
-        print("\nColor Scheme:")
-        print(f"- Recommendation: {thumbnail['color_scheme']['recommendation']}")
-        print(f"- Explanation: {thumbnail['color_scheme']['explanation']}")
+        lines.append("\nColor Scheme:")
+        lines.append(f"- Recommendation: {thumbnail['color_scheme']['recommendation']}")
+        lines.append(f"- Explanation: {thumbnail['color_scheme']['explanation']}")
         
-        print("\nRecommended Elements:")
+        lines.append("\nRecommended Elements:")
         for element in thumbnail["elements"]["recommendations"]:
-            print(f"- {element}")
+            lines.append(f"- {element}")
         
-        print("\nComposition Tips:")
+        lines.append("\nComposition Tips:")
         for tip in thumbnail["composition_tips"]:
-            print(f"- {tip}")
+            lines.append(f"- {tip}")
         
-        print("\nPotential Thumbnail Moments from Script:")
+        lines.append("\nPotential Thumbnail Moments from Script:")
         for moment in thumbnail["potential_moments"]:
-            print(f"- At {moment['position']} of video:")
-            print(f"  \"{moment['segment_text'][:100]}...\"")
+            lines.append(f"- At {moment['position']} of video:")
+            lines.append(f"  \"{moment['segment_text'][:100]}...\"")
+        print_lines(lines)
         
         # Save results
-        output_file = f"output/thumbnail_recommendations_{niche}.json"
-        os.makedirs("output", exist_ok=True)
-        with open(output_file, "w") as f:
-            json.dump(thumbnail, f, indent=4)
+        output_file = self._outdir / f"thumbnail_recommendations_{niche}.json"
+        save_json(output_file, thumbnail)
             
         print(f"\nDetailed thumbnail recommendations saved to {output_file}")
     
     def smart_content_planner(self):
         """Generate content plan based on all insights"""
+        from competitor_analysis import is_error
+        
         print("\n=== Smart Content Planner ===")
         
         # Get niche
         niche = self.get_niche()
         
-        # Check if we have competitor data
-        competitor_report = self.competitor_analyzer.generate_competition_report(niche)
-        has_competitor_data = not ("status" in competitor_report and competitor_report["status"] == "error")
+        # Check if we have competitor data; the report is only generated when there are videos
+        competitor_report = None
+        has_competitor_data = self.competitor_analyzer.count(niche) > 0
+        if has_competitor_data:
+            competitor_report = self.competitor_analyzer.generate_competition_report(niche)
+            has_competitor_data = not is_error(competitor_report)
         
         if not has_competitor_data:
             print("Warning: No competitor data available. Add competitor videos first for better results.")
@@ -544,7 +662,7 @@ class ContentOptimizer:
             print(f"Using insights from {competitor_report['total_videos_analyzed']} competitor videos")
         
         # Get basic info
-        video_topic = input("\nWhat's your video topic? ")
+        video_topic = ask("\nWhat's your video topic? ")
         
         # Content planning
         print("\nGenerating smart content plan...")
@@ -554,7 +672,7 @@ class ContentOptimizer:
             "niche": niche,
             "topic": video_topic,
             "has_competitor_data": has_competitor_data,
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
             "script_structure": [],
             "title_options": [],
             "thumbnail_strategy": {},
@@ -563,61 +681,21 @@ class ContentOptimizer:
         }
         
         # Add script structure based on niche
-        if niche == "productivity":
-            plan["script_structure"] = [
-                {"section": "Hook", "content": "Start with a surprising fact or result related to productivity"},
-                {"section": "Problem", "content": f"Describe the common challenges with {video_topic}"},
-                {"section": "Solution Overview", "content": "Briefly outline your approach/method"},
-                {"section": "Your Story", "content": "Share your personal experience with this approach"},
-                {"section": "Step-by-Step Implementation", "content": "Detailed walkthrough of the method"},
-                {"section": "Results", "content": "Show the outcomes and benefits achieved"},
-                {"section": "Viewer Application", "content": "How viewers can apply this to their own lives"},
-                {"section": "CTA", "content": "Ask for subscription and comments on viewers' experiences"}
-            ]
-        elif niche == "health_fitness":
-            plan["script_structure"] = [
-                {"section": "Hook", "content": "Show a transformation or end result to build curiosity"},
-                {"section": "Problem", "content": f"Discuss common struggles with {video_topic}"},
-                {"section": "Your Experience", "content": "Share your personal journey/credentials"},
-                {"section": "Method Introduction", "content": "Introduce your approach/technique"},
-                {"section": "Scientific Basis", "content": "Brief explanation of why this works"},
-                {"section": "Step-by-Step Guide", "content": "Detailed instructions for viewers"},
-                {"section": "Common Mistakes", "content": "Pitfalls to avoid for best results"},
-                {"section": "Expected Timeline", "content": "When viewers can expect to see results"},
-                {"section": "CTA", "content": "Invite viewers to share their progress in comments"}
-            ]
-        elif niche == "ai_tech":
-            plan["script_structure"] = [
-                {"section": "Hook", "content": "Demonstrate an impressive capability related to the topic"},
-                {"section": "Problem Context", "content": f"Explain why {video_topic} is important/relevant"},
-                {"section": "Technical Overview", "content": "Explain the core technology/concept"},
-                {"section": "Practical Demonstration", "content": "Show the technology in action"},
-                {"section": "Step-by-Step Guide", "content": "How viewers can implement this themselves"},
-                {"section": "Use Cases", "content": "Different applications or scenarios"},
-                {"section": "Limitations", "content": "Honest assessment of current limitations"},
-                {"section": "Future Potential", "content": "Where this technology is heading"},
-                {"section": "CTA", "content": "Encourage viewers to try it and share results"}
-            ]
+        plan["script_structure"] = [
+            {"section": section, "content": content.format(topic=video_topic)}
+            for section, content in SCRIPT_STRUCTURES.get(niche, ())
+        ]
         
         # Add title options using common patterns
         if has_competitor_data and "title_analysis" in competitor_report:
             patterns = competitor_report["title_analysis"]["pattern_usage"]
             # Use the top 2 patterns for title suggestions
-            top_patterns = sorted(patterns.items(), key=lambda x: x[1], reverse=True)[:2]
+            top_patterns = heapq.nlargest(2, patterns.items(), key=itemgetter(1))
             
             for pattern_name, percentage in top_patterns:
-                if pattern_name == "how_to":
-                    plan["title_options"].append(f"How to {video_topic} Like a Pro")
-                    plan["title_options"].append(f"How I Mastered {video_topic} in Just 30 Days")
-                elif pattern_name == "listicle":
-                    plan["title_options"].append(f"5 Game-Changing {video_topic} Techniques No One Talks About")
-                    plan["title_options"].append(f"7 Ways to Transform Your {video_topic} Results Overnight")
-                elif pattern_name == "question":
-                    plan["title_options"].append(f"Is {video_topic} Actually Worth Your Time? The Truth Revealed")
-                    plan["title_options"].append(f"Why Most People Fail at {video_topic} (And How Not To)")
-                elif pattern_name == "i_personal":
-                    plan["title_options"].append(f"I Tried {video_topic} for 30 Days | Here's What Happened")
-                    plan["title_options"].append(f"I Discovered This {video_topic} Secret and It Changed Everything")
+                plan["title_options"].extend(
+                    template.format(topic=video_topic) for template in PATTERN_TITLE_TEMPLATES.get(pattern_name, ())
+                )
         else:
             # Default title options if no competitor data
             plan["title_options"] = [
@@ -656,36 +734,56 @@ class ContentOptimizer:
         ]
         
         # Print plan summary
-        print("\n=== Content Plan Summary ===")
-        print(f"Topic: {video_topic}")
-        print(f"Niche: {niche}")
-        
-        print("\nScript Structure:")
+        lines = [
+            "\n=== Content Plan Summary ===",
+            f"Topic: {video_topic}",
+            f"Niche: {niche}",
+            "\nScript Structure:"
+        ]
         for i, section in enumerate(plan["script_structure"]):
-            print(f"{i+1}. {section['section']}: {section['content']}")
+            lines.append(f"{i+1}. {section['section']}: {section['content']}")
         
-        print("\nRecommended Title Options:")
+        lines.append("\nRecommended Title Options:")
         for i, title in enumerate(plan["title_options"]):
-            print(f"{i+1}. {title}")
+            lines.append(f"{i+1}. {title}")
         
-        print("\nThumbnail Strategy:")
-        print(f"- Composition: {plan['thumbnail_strategy']['composition']}")
-        print("- Elements:")
+        lines.append("\nThumbnail Strategy:")
+        lines.append(f"- Composition: {plan['thumbnail_strategy']['composition']}")
+        lines.append("- Elements:")
         for element in plan["thumbnail_strategy"]["elements"]:
-            print(f"  * {element}")
+            lines.append(f"  * {element}")
         
-        print("\nRetention Strategy:")
+        lines.append("\nRetention Strategy:")
         for strategy in plan["retention_strategy"]:
-            print(f"- {strategy}")
+            lines.append(f"- {strategy}")
+        print_lines(lines)
         
         # Save plan
-        output_file = f"output/content_plan_{niche}_{video_topic.replace(' ', '_')}.json"
-        os.makedirs("output", exist_ok=True)
-        with open(output_file, "w") as f:
-            json.dump(plan, f, indent=4)
+        output_file = self._outdir / f"content_plan_{niche}_{video_topic.replace(' ', '_')}.json"
+        save_json(output_file, plan)
             
         print(f"\nDetailed content plan saved to {output_file}")
     
+    def read_script(self, prompt):
+        """Read a script line by line up to 'END', or load it in one read from an @<file> line"""
+        print(prompt)
+        
+        line = read_line()
+        if line is not None and line.startswith("@"):
+            path = line[1:].strip()
+            try:
+                return Path(path).read_text(encoding="utf-8")
+            except OSError as e:
+                print(f"Error: Could not read script file {path}: {e}")
+                return ""
+                
+        script_lines = []
+        while line is not None and line != "END":
+            script_lines.append(line)
+            line = read_line()
+            
+        return "\n".join(script_lines)
+    
     def get_niche(self):
         """Get niche from user"""
         print("\nSelect content niche:")
@@ -693,16 +791,10 @@ class ContentOptimizer:
         print("2. Health & Fitness")
         print("3. AI & Technology")
         
-        niche_map = {
-            "1": "productivity",
-            "2": "health_fitness", 
-            "3": "ai_tech"
-        }
-        
         while True:
-            choice = input("Enter your choice (1-3): ")
-            if choice in niche_map:
-                return niche_map[choice]
+            niche = NICHE_MAP.get(ask("Enter your choice (1-3): "))
+            if niche is not None:
+                return niche
             print("Invalid choice. Please try again.")
 
 if __name__ == "__main__":
@@ -1,9 +1,19 @@
 import os
 import json
 import time
+from collections import Counter
 from pathlib import Path
 from competitor_analysis import CompetitorAnalyzer
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Title words that mark list-style and emotional title structures
+LIST_TITLE_WORDS = ('top', 'best', 'ways', 'tips')
+EMOTIONAL_TITLE_WORDS = ('amazing', 'incredible', 'shocking', 'surprising', 'best', 'worst')
+
 class DataIntegrationModule:
     """
     Integrates advanced data extraction with the YouTube optimization system
@@ -51,8 +61,11 @@ class DataIntegrationModule:
             
             # Step 3: Save the enhanced analysis
             analysis_file = self.data_dir / f"enhanced_analysis_{niche}.json"
-            with open(analysis_file, 'w', encoding='utf-8') as f:
-                json.dump(analysis, f, indent=4)
+            if orjson is not None:
+                analysis_file.write_bytes(orjson.dumps(analysis, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                with open(analysis_file, 'w', encoding='utf-8') as f:
+                    json.dump(analysis, f, indent=2)
                 
             print(f"Enhanced analysis saved to {analysis_file}")
             
@@ -87,8 +100,10 @@ class DataIntegrationModule:
             "summary": {}
         }
         
-        # Title DNA analysis
-        title_words = []
+        # Title DNA analysis - one pass collects word frequencies, title
+        # lengths and structure counts
+        word_freq = Counter()
+        total_title_words = 0
         title_structures = {
             "question": 0,
             "number": 0,
@@ -99,33 +114,30 @@ class DataIntegrationModule:
         
         for video in videos:
             title = video.get('title', '').lower()
-            title_words.extend([w for w in title.split() if len(w) > 3])
+            words = title.split()
+            total_title_words += len(words)
+            word_freq.update(w for w in words if len(w) > 3)
             
             # Analyze structure
             if '?' in title:
                 title_structures['question'] += 1
             if any(c.isdigit() for c in title):
                 title_structures['number'] += 1
-            if title.startswith('how to') or title.startswith('how i'):
+            if title.startswith(('how to', 'how i')):
                 title_structures['how_to'] += 1
-            if any(w in title for w in ['top', 'best', 'ways', 'tips']):
+            if any(w in title for w in LIST_TITLE_WORDS):
                 title_structures['list'] += 1
-            if any(w in title for w in ['amazing', 'incredible', 'shocking', 'surprising', 'best', 'worst']):
+            if any(w in title for w in EMOTIONAL_TITLE_WORDS):
                 title_structures['emotional'] += 1
         
-        # Get word frequency
-        word_freq = {}
-        for word in title_words:
-            word_freq[word] = word_freq.get(word, 0) + 1
-            
         # Get top title keywords
-        title_keywords = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:20]
+        title_keywords = word_freq.most_common(20)
         
         # Add title DNA to analysis
         analysis['title_dna'] = {
             "keywords": [{"word": w, "count": c} for w, c in title_keywords],
             "structures": {k: {"count": v, "percentage": (v / len(videos)) * 100} for k, v in title_structures.items()},
-            "avg_length": sum(len(v.get('title', '').split()) for v in videos) / len(videos)
+            "avg_length": total_title_words / len(videos)
         }
         
         # Script DNA analysis (if available)
@@ -296,7 +308,8 @@ class DataIntegrationModule:
             # Basic script analysis
             words = script_text.split()
             word_count = len(words)
-            hook = " ".join(words[:50])  # Approximate first 30 seconds
+            hook_words = words[:50]  # Approximate first 30 seconds
+            script_lower = script_text.lower()
             
             # Create recommendations
             recommendations = []
@@ -305,7 +318,7 @@ class DataIntegrationModule:
             hook_pattern = next((p for p in dna_patterns if p['element'] == 'script' and p['pattern'] == 'hook_length'), None)
             if hook_pattern:
                 optimal_hook_words = int(hook_pattern.get('value', 30))
-                current_hook_words = len(hook.split())
+                current_hook_words = len(hook_words)
                 
                 if abs(current_hook_words - optimal_hook_words) > 10:
                     recommendations.append({
@@ -335,7 +348,7 @@ class DataIntegrationModule:
             transition_pattern = next((p for p in dna_patterns if p['element'] == 'script' and p['pattern'] == 'clear_transitions'), None)
             if transition_pattern:
                 transition_markers = ["next", "now", "moving on", "let's talk about", "another", "additionally"]
-                found_transitions = [marker for marker in transition_markers if marker in script_text.lower()]
+                found_transitions = [marker for marker in transition_markers if marker in script_lower]
                 
                 if not found_transitions:
                     recommendations.append({
@@ -350,7 +363,7 @@ class DataIntegrationModule:
             cta_pattern = next((p for p in dna_patterns if p['element'] == 'script' and p['pattern'] == 'verbal_cta'), None)
             if cta_pattern:
                 cta_markers = ["subscribe", "like", "comment", "check out", "click", "link", "below"]
-                found_cta = [marker for marker in cta_markers if marker in script_text.lower()]
+                found_cta = [marker for marker in cta_markers if marker in script_lower]
                 
                 if not found_cta:
                     recommendations.append({
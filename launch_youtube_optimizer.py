@@ -62,7 +62,7 @@ def main():
     
     # Import system components
     from youtube_optimizer import YouTubeOptimizer
-    from competitor_analysis import CompetitorAnalyzer
+    from competitor_analysis import CompetitorAnalyzer, is_error
     
     # Import the main system
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -157,7 +157,7 @@ def main():
             # Analyze title patterns
             result = analyzer.analyze_title_patterns(niche)
             
-            if "status" in result and result["status"] == "error":
+            if is_error(result):
                 print(f"\nError: {result['message']}")
             else:
                 print(f"\nAnalyzed {result['total_videos_analyzed']} videos")
@@ -181,7 +181,7 @@ def main():
             # Analyze thumbnail patterns
             result = analyzer.analyze_thumbnail_patterns(niche)
             
-            if "status" in result and result["status"] == "error":
+            if is_error(result):
                 print(f"\nError: {result['message']}")
             else:
                 print(f"\nAnalyzed {result['total_thumbnails_analyzed']} thumbnails")
@@ -204,7 +204,7 @@ def main():
             # Generate competition report
             result = analyzer.generate_competition_report(niche)
             
-            if "status" in result and result["status"] == "error":
+            if is_error(result):
                 print(f"\nError: {result['message']}")
             else:
                 print(f"\nAnalyzed {result['total_videos_analyzed']} videos")
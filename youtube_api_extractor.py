@@ -3,17 +3,36 @@ import re
 import json
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, parse_qs
 
+# videos.list and channels.list accept at most 50 comma-separated IDs per request
+MAX_IDS_PER_REQUEST = 50
+# Lookups get_complete_video_analysis runs at the same time for one video
+ANALYSIS_LOOKUPS = 3
+
+class YouTubeAPIError(Exception):
+    """Error response from the YouTube API (status_code is the HTTP status)"""
+    
+    def __init__(self, message, status_code):
+        super().__init__(message)
+        self.status_code = status_code
+
 class YouTubeAPIExtractor:
     """
     YouTube data extraction using the official YouTube Data API v3
     This provides reliable access to video metadata, statistics, and captions
     """
     
-    def __init__(self, api_key):
+    def __init__(self, api_key, max_connections=10):
         self.api_key = api_key
         self.base_url = "https://www.googleapis.com/youtube/v3"
+        # Reuse one connection pool for all API calls (keep-alive to googleapis);
+        # max_connections should cover every thread sharing the session, since
+        # connections beyond the pool size are closed instead of kept alive
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=max_connections))
         
     def extract_video_id(self, url):
         """Extract video ID from YouTube URL"""
@@ -30,6 +49,23 @@ class YouTubeAPIExtractor:
         else:
             raise ValueError(f"Could not extract video ID from URL: {url}")
     
+    def validate_key(self):
+        """
+        Check that the API key is accepted using the cheapest available endpoint
+        (i18nLanguages.list costs 1 quota unit and returns a small payload)
+        """
+        try:
+            # Short timeout so a network stall cannot hang startup
+            self._make_api_request("i18nLanguages", timeout=3, part="snippet")
+            return {"success": True}
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "message": "API key validation failed"
+            }
+    
     def get_video_details(self, video_id):
         """
         Get comprehensive video details using multiple API endpoints
@@ -74,23 +110,61 @@ class YouTubeAPIExtractor:
             return {
                 "success": False,
                 "error": str(e),
-                "message": "API request failed"
+                "message": "API request failed",
+                "status_code": getattr(e, 'status_code', None)
+            }
+    
+    def get_multiple_video_details(self, video_ids):
+        """
+        Get video details for many videos with batched API requests
+        Returns {video_id: details} in the same format as get_video_details;
+        videos that were not found are left out
+        """
+        video_items = {}
+        for i in range(0, len(video_ids), MAX_IDS_PER_REQUEST):
+            video_response = self._make_api_request(
+                "videos",
+                part="snippet,contentDetails,statistics,status,topicDetails",
+                id=",".join(video_ids[i:i + MAX_IDS_PER_REQUEST])
+            )
+            for item in video_response.get('items', []):
+                video_items[item['id']] = item
+        
+        # Fetch each distinct channel once
+        channel_ids = list({item['snippet']['channelId'] for item in video_items.values()})
+        channel_items = {}
+        for i in range(0, len(channel_ids), MAX_IDS_PER_REQUEST):
+            channel_response = self._make_api_request(
+                "channels",
+                part="snippet,statistics",
+                id=",".join(channel_ids[i:i + MAX_IDS_PER_REQUEST])
+            )
+            for item in channel_response.get('items', []):
+                channel_items[item['id']] = item
+        
+        return {
+            video_id: {
+                "success": True,
+                "video_id": video_id,
+                "metadata": self._compile_metadata(video_data, channel_items.get(video_data['snippet']['channelId'], {}))
             }
+            for video_id, video_data in video_items.items()
+        }
     
-    def _make_api_request(self, endpoint, **params):
-        """Make a request to the YouTube API with appropriate parameters"""
+    def _make_api_request(self, endpoint, timeout=None, **params):
+        """Make a request to the YouTube API with appropriate parameters (timeout in seconds, None waits indefinitely)"""
         url = f"{self.base_url}/{endpoint}"
         
         # Add API key to params
         params['key'] = self.api_key
         
         # Make the request
-        response = requests.get(url, params=params)
+        response = self.session.get(url, params=params, timeout=timeout)
         
         # Check for errors
         if response.status_code != 200:
             error_message = response.json().get('error', {}).get('message', f"API Error: {response.status_code}")
-            raise Exception(error_message)
+            raise YouTubeAPIError(error_message, response.status_code)
             
         return response.json()
     
@@ -317,26 +391,35 @@ class YouTubeAPIExtractor:
                 "message": "Failed to retrieve related videos"
             }
     
-    def get_complete_video_analysis(self, video_url):
+    def get_complete_video_analysis(self, video_url, details=None):
         """
         Perform a complete analysis of a video using all available API endpoints
+        details can carry a result prefetched with get_multiple_video_details
         """
         try:
             video_id = self.extract_video_id(video_url)
             
             # Step 1: Get video details
-            details = self.get_video_details(video_id)
+            if details is None:
+                details = self.get_video_details(video_id)
             if not details.get('success', False):
                 return details
             
-            # Step 2: Check for transcript
-            transcript = self.get_transcript(video_id)
-            
-            # Step 3: Get top comments
-            comments = self.get_comments(video_id, max_results=10)
+            # Steps 2-4 are independent lookups, so issue them concurrently
+            # instead of paying one round-trip after another
+            with ThreadPoolExecutor(max_workers=ANALYSIS_LOOKUPS) as executor:
+                # Step 2: Check for transcript
+                transcript_future = executor.submit(self.get_transcript, video_id)
+                
+                # Step 3: Get top comments
+                comments_future = executor.submit(self.get_comments, video_id, max_results=10)
+                
+                # Step 4: Get related videos
+                related_future = executor.submit(self.get_related_videos, video_id, max_results=5)
             
-            # Step 4: Get related videos
-            related = self.get_related_videos(video_id, max_results=5)
+            transcript = transcript_future.result()
+            comments = comments_future.result()
+            related = related_future.result()
             
             # Compile the full analysis
             analysis = {
@@ -359,7 +442,8 @@ class YouTubeAPIExtractor:
                 "success": False,
                 "error": str(e),
                 "message": "Failed to complete video analysis",
-                "video_url": video_url
+                "video_url": video_url,
+                "status_code": getattr(e, 'status_code', None)
             }
     
     def _identify_patterns(self, analysis):
@@ -540,6 +624,7 @@ class YouTubeAPIExtractor:
         os.makedirs(output_dir, exist_ok=True)
         
         results = []
+        succeeded = 0
         for i, url in enumerate(video_urls):
             print(f"Processing video {i+1}/{len(video_urls)}: {url}")
             
@@ -557,10 +642,12 @@ class YouTubeAPIExtractor:
                 print(f"Analysis saved to {output_file}")
                 
                 # Add to results
+                success = analysis.get('success', False)
+                succeeded += success
                 results.append({
                     "video_id": video_id,
                     "video_url": url,
-                    "success": analysis.get('success', False),
+                    "success": success,
                     "output_file": output_file
                 })
                 
@@ -581,7 +668,7 @@ class YouTubeAPIExtractor:
         with open(summary_file, 'w', encoding='utf-8') as f:
             json.dump({
                 "processed_count": len(video_urls),
-                "success_count": sum(1 for r in results if r.get('success', False)),
+                "success_count": succeeded,
                 "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
                 "results": results
             }, f, indent=4)
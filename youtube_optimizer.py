@@ -9,6 +9,10 @@ from datetime import datetime
 # This is the core framework for your YouTube optimization system
 # You'll need to install: pip install requests numpy
 
+# Precompiled patterns shared by the script/title analyzers
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_WORD_RE = re.compile(r'\b[a-z]{3,15}\b')
+
 class YouTubeOptimizer:
     def __init__(self, api_key=None):
         self.api_key = api_key  # For future integration with YouTube API
@@ -103,13 +107,15 @@ class YouTubeOptimizer:
         if niche not in self.pattern_database:
             return {"error": f"Niche {niche} not found in pattern database"}
         
-        # Basic analysis
-        word_count = len(script_text.split())
-        sentences = re.split(r'[.!?]+', script_text)
+        # Basic analysis - tokenize once and reuse the word list below
+        words = script_text.split()
+        word_count = len(words)
+        sentences = _SENTENCE_SPLIT_RE.split(script_text)
         avg_sentence_length = word_count / max(len(sentences), 1)
         
         # Identify hook (first 100 words)
-        hook = " ".join(script_text.split()[:100])
+        hook_words = words[:100]
+        hook = " ".join(hook_words)
         
         # Check for retention markers
         retention_markers = self.pattern_database[niche]["script_patterns"]["retention_markers"]
@@ -134,8 +140,7 @@ class YouTubeOptimizer:
             # Get context around this position (50 words)
             start = max(0, word_pos - 25)
             end = min(word_count, word_pos + 25)
-            context_words = script_text.split()[start:end]
-            context = " ".join(context_words)
+            context = " ".join(words[start:end])
             
             marker_analysis.append({
                 "expected_position": position,
@@ -165,7 +170,7 @@ class YouTubeOptimizer:
             "word_count": word_count,
             "estimated_duration": f"{round(total_minutes, 2)} minutes",
             "avg_sentence_length": round(avg_sentence_length, 2),
-            "hook_analysis": {"text": hook, "word_count": len(hook.split())},
+            "hook_analysis": {"text": hook, "word_count": len(hook_words)},
             "retention_marker_analysis": marker_analysis,
             "structure_analysis": structure_analysis,
             "recommendations": recommendations
@@ -218,7 +223,7 @@ class YouTubeOptimizer:
             })
         
         # Keywords analysis (very basic)
-        common_words = Counter(re.findall(r'\b[a-z]{3,15}\b', script_text.lower()))
+        common_words = Counter(_WORD_RE.findall(script_text.lower()))
         most_common = common_words.most_common(5)
         recommendations.append({
             "type": "keywords",
@@ -234,7 +239,7 @@ class YouTubeOptimizer:
             return {"error": f"Niche {niche} not found in pattern database"}
         
         # Extract key terms from script (very basic approach)
-        words = re.findall(r'\b[a-z]{3,15}\b', script_text.lower())
+        words = _WORD_RE.findall(script_text.lower())
         word_freq = Counter(words)
         common_terms = [word for word, count in word_freq.most_common(10) if count > 1]
         
@@ -309,7 +314,7 @@ class YouTubeOptimizer:
             return {"error": f"Niche {niche} not found in pattern database"}
         
         # Extract key terms
-        words = re.findall(r'\b[a-z]{3,15}\b', script_text.lower())
+        words = _WORD_RE.findall(script_text.lower())
         word_freq = Counter(words)
         keywords = [word for word, count in word_freq.most_common(15) if count > 1]
         